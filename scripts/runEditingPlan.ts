@@ -10,7 +10,6 @@ import { createLogger } from '../src/utils/logger';
 import { EditingPlanService } from '../src/services/content-analysis/editingPlanService';
 import { HighlightDetectionService } from '../src/services/content-analysis/highlightDetectionService';
 import { TranscriptionService } from '../src/services/transcription/transcriptionService';
-import fs from 'fs/promises';
 import path from 'path';
 
 const logger = createLogger('EditingPlanStep');
@@ -21,8 +20,7 @@ async function runEditingPlan(srtPath: string, videoDuration: number, outputPath
   try {
     // Parse SRT file
     const transcriptionService = new TranscriptionService();
-    const content = await fs.readFile(srtPath, 'utf-8');
-    const segments = await transcriptionService['parseSRT'](content);
+    const segments = await transcriptionService['parseSRT'](srtPath);
 
     // Detect highlights
     const highlightService = new HighlightDetectionService();
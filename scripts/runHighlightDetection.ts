@@ -25,13 +25,16 @@ async function runHighlightDetection(srtPath: string) {
 
     // Display highlights
     if (highlights.length > 0) {
-      console.log('Detected highlights:');
+      // Build the listing first and print it in one write; long videos can
+      // produce hundreds of highlights
+      const lines = ['Detected highlights:'];
       highlights.forEach((highlight, i) => {
-        console.log(`  ${i + 1}. [${highlight.startTime.toFixed(2)}s - ${highlight.endTime.toFixed(2)}s]`);
-        console.log(`     Reason: ${highlight.reason}`);
-        console.log(`     Confidence: ${(highlight.confidence * 100).toFixed(1)}%`);
+        lines.push(`  ${i + 1}. [${highlight.startTime.toFixed(2)}s - ${highlight.endTime.toFixed(2)}s]`);
+        lines.push(`     Reason: ${highlight.reason}`);
+        lines.push(`     Confidence: ${(highlight.confidence * 100).toFixed(1)}%`);
       });
-      console.log();
+      lines.push('');
+      console.log(lines.join('\n'));
     } else {
       console.log('No highlights detected. Will use default parameters.\n');
     }
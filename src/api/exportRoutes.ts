@@ -9,6 +9,9 @@ import path from 'path';
 
 const logger = createLogger('ExportRoutes');
 
+// `wasabi://bucket/` prefix stripped from stored output paths to get the object key
+const WASABI_URI_PREFIX = /^wasabi:\/\/[^/]+\//;
+
 export const exportRouter = express.Router();
 
 const sheetsService = new SheetsStorageService();
@@ -44,6 +47,7 @@ exportRouter.get(
       }
 
       // Get transcript from Google Sheets
+      await sheetsService.initialize();
       const transcript = await sheetsService.getTranscript(jobId);
 
       if (!transcript || transcript.length === 0) {
@@ -117,6 +121,7 @@ exportRouter.post(
       }
 
       // Get transcript from Google Sheets
+      await sheetsService.initialize();
       const transcript = await sheetsService.getTranscript(jobId);
 
       if (!transcript || transcript.length === 0) {
@@ -180,7 +185,7 @@ exportRouter.get(
       }
 
       // Extract key from path (format: wasabi://bucket/key)
-      const videoKey = uploadedStage.outputPath.replace(/^wasabi:\/\/[^/]+\//, '');
+      const videoKey = uploadedStage.outputPath.replace(WASABI_URI_PREFIX, '');
 
       // Generate signed URL
       const signedUrl = await storageService.getSignedUrl(videoKey, { expiresIn: 7 * 24 * 60 * 60 }); // 7 days
@@ -234,7 +239,7 @@ exportRouter.get(
       }
 
       // Extract key from path
-      const videoKey = autoEditStage.outputPath.replace(/^wasabi:\/\/[^/]+\//, '');
+      const videoKey = autoEditStage.outputPath.replace(WASABI_URI_PREFIX, '');
 
       // Generate signed URL
       const signedUrl = await storageService.getSignedUrl(videoKey, { expiresIn: 7 * 24 * 60 * 60 }); // 7 days
@@ -346,14 +351,14 @@ exportRouter.get(
       // Get raw video URL
       const uploadedStage = job.processingStages.find(s => s.stage === 'uploaded');
       if (uploadedStage?.outputPath) {
-        const videoKey = uploadedStage.outputPath.replace(/^wasabi:\/\/[^/]+\//, '');
+        const videoKey = uploadedStage.outputPath.replace(WASABI_URI_PREFIX, '');
         links.videos.raw = await storageService.getSignedUrl(videoKey, { expiresIn: 7 * 24 * 60 * 60 });
       }
 
       // Get edited video URL
       const autoEditStage = job.processingStages.find(s => s.stage === 'auto-editing');
       if (autoEditStage?.outputPath) {
-        const videoKey = autoEditStage.outputPath.replace(/^wasabi:\/\/[^/]+\//, '');
+        const videoKey = autoEditStage.outputPath.replace(WASABI_URI_PREFIX, '');
         links.videos.edited = await storageService.getSignedUrl(videoKey, { expiresIn: 7 * 24 * 60 * 60 });
       }
 
@@ -364,6 +369,7 @@ exportRouter.get(
       }
 
       // Get transcript links
+      await sheetsService.initialize();
       const transcript = await sheetsService.getTranscript(jobId);
       if (transcript && transcript.length > 0) {
         links.transcript.srt = `${req.protocol}://${req.get('host')}/api/export/srt/${jobId}`;
@@ -12,6 +12,7 @@ export interface SystemConfig {
   };
   whisper: {
     model: string;
+    fp16: boolean;
   };
   gemini: {
     apiKey: string;
@@ -68,6 +69,7 @@ export const config: SystemConfig = {
   },
   whisper: {
     model: getOptionalEnvVar('WHISPER_MODEL', 'base'),
+    fp16: process.env.WHISPER_FP16 !== 'false', // Half precision on GPU; set false on CPU-only hosts
   },
   gemini: {
     apiKey: getOptionalEnvVar('GEMINI_API_KEY'),
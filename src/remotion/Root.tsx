@@ -37,7 +37,6 @@ export const RemotionRoot: React.FC = () => {
             transitions: [],
             brollPlacements: [],
           },
-          subtitles: [],
           brollVideos: [],
         }}
         calculateMetadata={({ props }: any) => {
@@ -0,0 +1,75 @@
+/**
+ * Video Composition Tests
+ */
+
+import { describe, it, expect } from 'vitest';
+import { buildZoomTimeline, findActiveZoomIndex } from './VideoComposition';
+import { ZoomEffect } from '../services/content-analysis/editingPlanService';
+
+function zoom(id: string, startTime: number, endTime: number): ZoomEffect {
+  return {
+    id,
+    startTime,
+    endTime,
+    targetScale: 1.2,
+    easingFunction: 'ease-in-out',
+    zoomDuration: 300,
+  };
+}
+
+describe('findActiveZoomIndex', () => {
+  it('should return -1 when no zoom effect is active', () => {
+    const timeline = buildZoomTimeline([zoom('a', 1, 2), zoom('b', 4, 5)]);
+
+    expect(findActiveZoomIndex(0.5, timeline)).toBe(-1);
+    expect(findActiveZoomIndex(3, timeline)).toBe(-1);
+    expect(findActiveZoomIndex(6, timeline)).toBe(-1);
+    expect(findActiveZoomIndex(1, buildZoomTimeline([]))).toBe(-1);
+  });
+
+  it('should include both ends of an effect', () => {
+    const timeline = buildZoomTimeline([zoom('a', 1, 2)]);
+
+    expect(findActiveZoomIndex(1, timeline)).toBe(0);
+    expect(findActiveZoomIndex(2, timeline)).toBe(0);
+  });
+
+  it('should prefer the earliest-starting effect when effects overlap', () => {
+    // 'long' is still running past 'short', which starts and ends inside it
+    const timeline = buildZoomTimeline([
+      zoom('short', 3, 4),
+      zoom('long', 0, 10),
+      zoom('late', 8, 12),
+    ]);
+
+    expect(timeline.effects[findActiveZoomIndex(3.5, timeline)].id).toBe('long');
+    expect(timeline.effects[findActiveZoomIndex(9, timeline)].id).toBe('long');
+    expect(timeline.effects[findActiveZoomIndex(11, timeline)].id).toBe('late');
+  });
+
+  it('should match a linear scan over the sorted effects', () => {
+    // Deterministic pseudo-random effects so failures are reproducible
+    let seed = 42;
+    const random = () => {
+      seed = (seed * 16807) % 2147483647;
+      return seed / 2147483647;
+    };
+
+    for (let round = 0; round < 50; round++) {
+      const effects: ZoomEffect[] = [];
+      for (let i = 0; i < 20; i++) {
+        const startTime = Math.round(random() * 600) / 10;
+        effects.push(zoom(`z${i}`, startTime, startTime + Math.round(random() * 100) / 10));
+      }
+
+      const timeline = buildZoomTimeline(effects);
+
+      for (let t = 0; t <= 70; t += 0.25) {
+        const expected = timeline.effects.findIndex(
+          (effect) => t >= effect.startTime && t <= effect.endTime
+        );
+        expect(findActiveZoomIndex(t, timeline)).toBe(expected);
+      }
+    }
+  });
+});
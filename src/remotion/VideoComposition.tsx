@@ -14,23 +14,31 @@ import { TemplateLoader } from './templateLoader';
 import { EditingPlan, ZoomEffect, TextHighlight, SoundEffectPlacement } from '../services/content-analysis/editingPlanService';
 import { applyBrandKitToTextStyle } from './brandKitHelper';
 
+// Easing curves are built once and shared by every frame
+const EASE_IN_OUT = Easing.inOut(Easing.ease);
+const EASE_OUT = Easing.out(Easing.ease);
+
+// A Map, so unvalidated names like 'constructor' can't resolve to Object.prototype members
+const EASING_FUNCTIONS: ReadonlyMap<string, (t: number) => number> = new Map([
+  ['ease-in-out', EASE_IN_OUT],
+  ['ease-in', Easing.in(Easing.ease)],
+  ['ease-out', EASE_OUT],
+  ['linear', (t: number) => t],
+]);
+
+// Shared default so the memoised frame ranges stay stable when no sound effects are passed
+const NO_SOUND_EFFECTS: SoundEffectPathMapping[] = [];
+
 export interface VideoCompositionProps {
   videoPath: string;
   videoDuration: number;
   videoWidth: number;
   videoHeight: number;
   editingPlan: EditingPlan;
-  subtitles: SubtitleSegment[];
   brollVideos: BrollVideoMapping[];
   soundEffectPaths?: SoundEffectPathMapping[];
 }
 
-export interface SubtitleSegment {
-  startTime: number;
-  endTime: number;
-  text: string;
-}
-
 export interface BrollVideoMapping {
   startTime: number;
   duration: number;
@@ -63,20 +71,72 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
   videoWidth,
   videoHeight,
   editingPlan,
-  subtitles,
   brollVideos,
-  soundEffectPaths = [],
+  soundEffectPaths = NO_SOUND_EFFECTS,
 }) => {
   const frame = useCurrentFrame();
   const { fps } = useVideoConfig();
   const currentTime = frame / fps;
 
+  // Flatten zoom effect timing once; the plan does not change between frames
+  const zoomTimeline = React.useMemo(
+    () => buildZoomTimeline(editingPlan.zoomEffects || []),
+    [editingPlan.zoomEffects]
+  );
+
+  // Resolve animation template components once per plan rather than per frame
+  const animationComponents = React.useMemo(
+    () =>
+      editingPlan.animations.map((animation) => {
+        const component = TemplateLoader.getTemplateComponent(animation.template as any);
+        if (!component) {
+          console.warn(`Template not found: ${animation.template}`);
+        }
+        return component;
+      }),
+    [editingPlan.animations]
+  );
+
+  // Convert second-based timings to frame ranges once; the plan and fps do not
+  // change between frames
+  const sequenceFrames = React.useMemo(
+    () => ({
+      soundEffects: soundEffectPaths.map((sfx) => Math.floor(sfx.timestamp * fps)),
+      broll: brollVideos.map((broll) => toFrameRange(broll.startTime, broll.duration, fps)),
+      highlights: editingPlan.highlights.map((highlight) =>
+        toFrameRange(highlight.startTime, highlight.endTime - highlight.startTime, fps)
+      ),
+      animations: editingPlan.animations.map((animation) =>
+        toFrameRange(animation.startTime, animation.duration, fps)
+      ),
+      transitions: editingPlan.transitions.map((transition) =>
+        toFrameRange(transition.time, transition.duration, fps)
+      ),
+      textHighlights: (editingPlan.textHighlights || []).map((textHighlight) =>
+        toFrameRange(textHighlight.startTime, textHighlight.duration, fps)
+      ),
+    }),
+    [
+      soundEffectPaths,
+      brollVideos,
+      editingPlan.highlights,
+      editingPlan.animations,
+      editingPlan.transitions,
+      editingPlan.textHighlights,
+      fps,
+    ]
+  );
+
   // Calculate zoom scale based on active zoom effects
-  const zoomScale = calculateZoomScale(currentTime, editingPlan.zoomEffects || [], fps);
+  const zoomScale = calculateZoomScale(currentTime, zoomTimeline);
 
   // Apply cut filters via CSS filters (basic implementation)
   // Note: Advanced color grading should be done via FFmpeg preprocessing
-  const cutFilterStyle = applyCutFilters(editingPlan.cutFilters);
+  // The filter string only depends on the plan, so build it once
+  const cutFilterStyle = React.useMemo(
+    () => applyCutFilters(editingPlan.cutFilters),
+    [editingPlan.cutFilters]
+  );
 
   return (
     <AbsoluteFill style={{ backgroundColor: 'black' }}>
@@ -106,12 +166,10 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
 
       {/* Sound effects */}
       {soundEffectPaths.map((sfx, index) => {
-        const startFrame = Math.floor(sfx.timestamp * fps);
-        
         return (
           <Sequence
             key={`sfx-${index}`}
-            from={startFrame}
+            from={sequenceFrames.soundEffects[index]}
           >
             <RemotionAudio
               src={staticFile(sfx.localPath)}
@@ -127,8 +185,7 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
 
       {/* B-roll overlays */}
       {brollVideos.map((broll, index) => {
-        const startFrame = Math.floor(broll.startTime * fps);
-        const durationInFrames = Math.floor(broll.duration * fps);
+        const { startFrame, durationInFrames } = sequenceFrames.broll[index];
 
         return (
           <Sequence
@@ -147,10 +204,7 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
 
       {/* Highlight effects */}
       {editingPlan.highlights.map((highlight, index) => {
-        const startFrame = Math.floor(highlight.startTime * fps);
-        const durationInFrames = Math.floor(
-          (highlight.endTime - highlight.startTime) * fps
-        );
+        const { startFrame, durationInFrames } = sequenceFrames.highlights[index];
 
         return (
           <Sequence
@@ -168,15 +222,11 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
 
       {/* Animations */}
       {editingPlan.animations.map((animation, index) => {
-        const startFrame = Math.floor(animation.startTime * fps);
-        const durationInFrames = Math.floor(animation.duration * fps);
+        const { startFrame, durationInFrames } = sequenceFrames.animations[index];
 
-        const TemplateComponent = TemplateLoader.getTemplateComponent(
-          animation.template as any
-        );
+        const TemplateComponent = animationComponents[index];
 
         if (!TemplateComponent) {
-          console.warn(`Template not found: ${animation.template}`);
           return null;
         }
 
@@ -196,8 +246,7 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
 
       {/* Transitions */}
       {editingPlan.transitions.map((transition, index) => {
-        const transitionFrame = Math.floor(transition.time * fps);
-        const durationInFrames = Math.floor(transition.duration * fps);
+        const { startFrame: transitionFrame, durationInFrames } = sequenceFrames.transitions[index];
 
         return (
           <Sequence
@@ -216,8 +265,7 @@ export const VideoComposition: React.FC<VideoCompositionProps> = ({
       {/* Text Highlights (Requirements 17.2, 18.1-18.4) */}
       {/* Only render text highlights from editing plan, not continuous subtitles */}
       {editingPlan.textHighlights && editingPlan.textHighlights.map((textHighlight, index) => {
-        const startFrame = Math.floor(textHighlight.startTime * fps);
-        const durationInFrames = Math.floor(textHighlight.duration * fps);
+        const { startFrame, durationInFrames } = sequenceFrames.textHighlights[index];
 
         return (
           <Sequence
@@ -433,8 +481,12 @@ const TextHighlightOverlay: React.FC<{ textHighlight: TextHighlight }> = ({ text
   const frame = useCurrentFrame();
   const { fps } = useVideoConfig();
   
-  // Apply brand kit styling to text style
-  const styledText = applyBrandKitToTextStyle(textHighlight);
+  // Apply brand kit styling to text style; it only depends on the highlight,
+  // so resolve it once rather than on every frame
+  const styledText = React.useMemo(
+    () => applyBrandKitToTextStyle(textHighlight),
+    [textHighlight]
+  );
   
   // Animation based on style
   const opacity = getTextAnimationOpacity(frame, fps, styledText.style.animation);
@@ -527,7 +579,7 @@ function getTextAnimationTransform(
       {
         extrapolateLeft: 'clamp',
         extrapolateRight: 'clamp',
-        easing: Easing.out(Easing.ease),
+        easing: EASE_OUT,
       }
     );
     return `translateY(${translateY}px)`;
@@ -541,7 +593,7 @@ function getTextAnimationTransform(
       {
         extrapolateLeft: 'clamp',
         extrapolateRight: 'clamp',
-        easing: Easing.out(Easing.ease),
+        easing: EASE_OUT,
       }
     );
     return `scale(${scale})`;
@@ -550,27 +602,110 @@ function getTextAnimationTransform(
   return 'none';
 }
 
+/**
+ * Start frame and length of a timed overlay
+ */
+interface FrameRange {
+  startFrame: number;
+  durationInFrames: number;
+}
+
+/**
+ * Convert a start time and duration in seconds to a frame range
+ */
+function toFrameRange(startSeconds: number, durationSeconds: number, fps: number): FrameRange {
+  return {
+    startFrame: Math.floor(startSeconds * fps),
+    durationInFrames: Math.floor(durationSeconds * fps),
+  };
+}
+
+/**
+ * Zoom effect timing stored as parallel arrays for per-frame lookup
+ */
+export interface ZoomTimeline {
+  startTimes: Float64Array;
+  endTimes: Float64Array;
+  zoomSeconds: Float64Array;
+  zoomOutStartTimes: Float64Array;
+  /** Running maximum of endTimes, used to bound the backward scan */
+  maxEndTimes: Float64Array;
+  effects: ZoomEffect[];
+}
+
+/**
+ * Build zoom timeline from editing plan zoom effects, sorted by start time
+ */
+export function buildZoomTimeline(zoomEffects: ZoomEffect[]): ZoomTimeline {
+  const effects = [...zoomEffects].sort((a, b) => a.startTime - b.startTime);
+  const count = effects.length;
+  const startTimes = new Float64Array(count);
+  const endTimes = new Float64Array(count);
+  const zoomSeconds = new Float64Array(count);
+  const zoomOutStartTimes = new Float64Array(count);
+  const maxEndTimes = new Float64Array(count);
+
+  for (let i = 0; i < count; i++) {
+    const zoom = effects[i];
+    startTimes[i] = zoom.startTime;
+    endTimes[i] = zoom.endTime;
+    // Derived timing is fixed per effect, so compute it here rather than per frame
+    zoomSeconds[i] = zoom.zoomDuration / 1000;
+    zoomOutStartTimes[i] = zoom.endTime - zoomSeconds[i];
+    maxEndTimes[i] = i > 0 ? Math.max(maxEndTimes[i - 1], zoom.endTime) : zoom.endTime;
+  }
+
+  return { startTimes, endTimes, zoomSeconds, zoomOutStartTimes, maxEndTimes, effects };
+}
+
+/**
+ * Find the earliest-starting zoom effect active at the given time
+ * Binary search for the last effect starting at or before currentTime, then
+ * walk back only while an earlier effect could still be running
+ */
+export function findActiveZoomIndex(currentTime: number, zoomTimeline: ZoomTimeline): number {
+  const { startTimes, endTimes, maxEndTimes } = zoomTimeline;
+
+  let lo = 0;
+  let hi = startTimes.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    if (startTimes[mid] <= currentTime) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+
+  let activeIndex = -1;
+  for (let i = lo - 1; i >= 0 && maxEndTimes[i] >= currentTime; i--) {
+    if (endTimes[i] >= currentTime) {
+      activeIndex = i;
+    }
+  }
+
+  return activeIndex;
+}
+
 /**
  * Calculate zoom scale based on active zoom effects
  * Implements smooth zoom in/out with configurable easing
  */
 function calculateZoomScale(
   currentTime: number,
-  zoomEffects: ZoomEffect[],
-  fps: number
+  zoomTimeline: ZoomTimeline
 ): number {
   // Find active zoom effect at current time
-  const activeZoom = zoomEffects.find(
-    (zoom) => currentTime >= zoom.startTime && currentTime <= zoom.endTime
-  );
+  const activeIndex = findActiveZoomIndex(currentTime, zoomTimeline);
 
-  if (!activeZoom) {
+  if (activeIndex === -1) {
     return 1.0; // No zoom, normal scale
   }
 
-  const zoomDurationSeconds = activeZoom.zoomDuration / 1000;
-  const effectDuration = activeZoom.endTime - activeZoom.startTime;
-  const timeInEffect = currentTime - activeZoom.startTime;
+  const activeZoom = zoomTimeline.effects[activeIndex];
+
+  const zoomDurationSeconds = zoomTimeline.zoomSeconds[activeIndex];
+  const timeInEffect = currentTime - zoomTimeline.startTimes[activeIndex];
 
   // Zoom in phase (first zoomDuration seconds)
   if (timeInEffect <= zoomDurationSeconds) {
@@ -588,7 +723,7 @@ function calculateZoomScale(
   }
 
   // Hold phase (middle of effect)
-  const zoomOutStartTime = activeZoom.endTime - zoomDurationSeconds;
+  const zoomOutStartTime = zoomTimeline.zoomOutStartTimes[activeIndex];
   if (currentTime < zoomOutStartTime) {
     return activeZoom.targetScale; // Hold at target scale
   }
@@ -612,18 +747,7 @@ function calculateZoomScale(
  * Get Remotion easing function from string
  */
 function getEasingFunction(easingName: string): (t: number) => number {
-  switch (easingName) {
-    case 'ease-in-out':
-      return Easing.inOut(Easing.ease);
-    case 'ease-in':
-      return Easing.in(Easing.ease);
-    case 'ease-out':
-      return Easing.out(Easing.ease);
-    case 'linear':
-      return (t) => t;
-    default:
-      return Easing.inOut(Easing.ease);
-  }
+  return EASING_FUNCTIONS.get(easingName) ?? EASE_IN_OUT;
 }
 
 /**
@@ -656,6 +780,8 @@ function applyCutFilters(cutFilters?: any): React.CSSProperties {
   }
 
   const filters: string[] = [];
+  // Track whether contrast was set rather than scanning the filter strings later
+  let hasContrast = false;
 
   // Apply color grading
   if (cutFilters.colorGrading) {
@@ -663,6 +789,7 @@ function applyCutFilters(cutFilters?: any): React.CSSProperties {
     
     if (contrast !== undefined && contrast !== 1.0) {
       filters.push(`contrast(${contrast})`);
+      hasContrast = true;
     }
     
     if (saturation !== undefined && saturation !== 1.0) {
@@ -674,7 +801,7 @@ function applyCutFilters(cutFilters?: any): React.CSSProperties {
   if (cutFilters.applySharpening && cutFilters.sharpeningIntensity) {
     // Sharpening approximation via contrast
     const sharpenContrast = 1.0 + (cutFilters.sharpeningIntensity * 0.1);
-    if (!filters.some(f => f.startsWith('contrast'))) {
+    if (!hasContrast) {
       filters.push(`contrast(${sharpenContrast})`);
     }
   }
@@ -24,42 +24,40 @@ export interface BrandKitTypography {
   fontWeight: number;
 }
 
+// Crown Mercado defaults are built once and shared by every call, so they are
+// frozen to keep one caller's changes from leaking into later renders
+const DEFAULT_BRAND_COLORS: BrandKitColors = Object.freeze({
+  primary: CROWN_MERCADO_BRAND.colors.primaryRed,
+  secondary: CROWN_MERCADO_BRAND.colors.charcoal,
+  accent: CROWN_MERCADO_BRAND.colors.accentRed,
+  textColor: CROWN_MERCADO_BRAND.colors.textPrimary,
+  backgroundColor: CROWN_MERCADO_BRAND.colors.charcoal,
+});
+
+const DEFAULT_BRAND_TYPOGRAPHY: BrandKitTypography = Object.freeze({
+  fontFamily: CROWN_MERCADO_BRAND.typography.headlineFont,
+  fontSize: Object.freeze({
+    small: 28,
+    medium: 56,
+    large: 84,
+  }),
+  fontWeight: 700,
+});
+
 /**
  * Convert brand kit colors to template props
  */
 export function getBrandColors(brandKit?: BrandKitColors): BrandKitColors {
-  if (brandKit) {
-    return brandKit;
-  }
-
   // Default to Crown Mercado brand
-  return {
-    primary: CROWN_MERCADO_BRAND.colors.primaryRed,
-    secondary: CROWN_MERCADO_BRAND.colors.charcoal,
-    accent: CROWN_MERCADO_BRAND.colors.accentRed,
-    textColor: CROWN_MERCADO_BRAND.colors.textPrimary,
-    backgroundColor: CROWN_MERCADO_BRAND.colors.charcoal,
-  };
+  return brandKit || DEFAULT_BRAND_COLORS;
 }
 
 /**
  * Convert brand kit typography to template props
  */
 export function getBrandTypography(brandKit?: BrandKitTypography): BrandKitTypography {
-  if (brandKit) {
-    return brandKit;
-  }
-
   // Default to Crown Mercado brand
-  return {
-    fontFamily: CROWN_MERCADO_BRAND.typography.headlineFont,
-    fontSize: {
-      small: 28,
-      medium: 56,
-      large: 84,
-    },
-    fontWeight: 700,
-  };
+  return brandKit || DEFAULT_BRAND_TYPOGRAPHY;
 }
 
 /**
@@ -15,6 +15,8 @@ export interface TemplateInfo {
 }
 
 export class TemplateLoader {
+  private static templateListForLLM: string | null = null;
+
   /**
    * Get all available template names
    */
@@ -91,6 +93,11 @@ export class TemplateLoader {
    * Generate template list for LLM prompt
    */
   static generateTemplateListForLLM(): string {
+    // Template metadata is static, so the prompt text only needs building once
+    if (this.templateListForLLM !== null) {
+      return this.templateListForLLM;
+    }
+
     const templates = this.getAllTemplateInfo();
     let output = 'Available Animation Templates:\n\n';
     
@@ -100,6 +107,7 @@ export class TemplateLoader {
       output += `  Parameters: ${info.parameters.join(', ')}\n\n`;
     }
     
+    this.templateListForLLM = output;
     return output;
   }
 }
@@ -29,7 +29,8 @@ export function AnimatedText({
   const frame = useCurrentFrame();
   const { fps } = useVideoConfig();
 
-  const characters = text.split("");
+  // Split once per text rather than on every frame
+  const characters = React.useMemo(() => text.split(""), [text]);
 
   return (
     <div
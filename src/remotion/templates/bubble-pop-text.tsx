@@ -18,6 +18,9 @@ export function BubblePopText({
   const frame = useCurrentFrame();
   const { fps } = useVideoConfig();
 
+  // Split once per text rather than on every frame
+  const characters = React.useMemo(() => text.split(""), [text]);
+
   return (
     <div
       style={{
@@ -29,7 +32,7 @@ export function BubblePopText({
         gap: "0.5rem",
       }}
     >
-      {text.split("").map((char, i) => {
+      {characters.map((char, i) => {
         const delay = i * 5;
         const scale = spring({
           frame: frame - delay,
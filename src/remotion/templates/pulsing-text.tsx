@@ -26,6 +26,9 @@ export function PulsingText({
 }: PulsingTextProps) {
   const frame = useCurrentFrame();
 
+  // Split once per text rather than on every frame
+  const characters = React.useMemo(() => text.split(""), [text]);
+
   return (
     <div
       style={{
@@ -37,10 +40,11 @@ export function PulsingText({
         gap: "1rem",
       }}
     >
-      {text.split("").map((char, i) => {
+      {characters.map((char, i) => {
         const delay = i * 6;
+        const phase = ((frame - delay) % 30) / 30;
         const pulse = interpolate(
-          ((frame - delay) % 30) / 30,
+          phase,
           [0, 0.5, 1],
           [1, 1.2, 1],
           {
@@ -49,7 +53,7 @@ export function PulsingText({
         );
 
         const opacity = interpolate(
-          ((frame - delay) % 30) / 30,
+          phase,
           [0, 0.5, 1],
           [0.5, 1, 0.5],
           {
@@ -126,6 +126,37 @@ describe('EditingPlanService', () => {
       expect(() => (service as any).validatePlan(plan, 30.0)).not.toThrow();
     });
 
+    it('should keep the order of zoom effects that do not overlap', () => {
+      const zoom = (id: string, startTime: number, endTime: number) => ({
+        id,
+        startTime,
+        endTime,
+        targetScale: 1.2,
+        easingFunction: 'ease-in-out' as const,
+        zoomDuration: 400,
+      });
+      const plan: EditingPlan = {
+        highlights: [],
+        animations: [],
+        transitions: [],
+        brollPlacements: [],
+        zoomEffects: [zoom('zoom-late', 10.0, 12.0), zoom('zoom-early', 1.0, 3.0)],
+        soundEffects: [],
+        textHighlights: [],
+        cutFilters: {
+          colorGrading: { temperature: 0, tint: 0, contrast: 1.1, saturation: 1.1, highlights: 0, shadows: 0 },
+          applySharpening: false,
+          sharpeningIntensity: 0.2,
+          applyVignette: true,
+          vignetteIntensity: 0.12,
+        },
+      };
+
+      (service as any).validatePlan(plan, 30.0);
+
+      expect(plan.zoomEffects.map((z) => z.id)).toEqual(['zoom-late', 'zoom-early']);
+    });
+
     it('should reject highlight with invalid timestamps', () => {
       const plan: EditingPlan = {
         highlights: [
@@ -8,6 +8,16 @@ import { TemplateLoader } from '../../remotion/templateLoader';
 
 const logger = createLogger('EditingPlanService');
 
+// Allowed values for plan validation, built once and shared by every call
+const VALID_HIGHLIGHT_EFFECT_TYPES: ReadonlySet<string> = new Set(['zoom', 'highlight-box', 'text-overlay']);
+const VALID_TRANSITION_TYPES: ReadonlySet<string> = new Set(['fade', 'slide', 'wipe']);
+const VALID_EASING_FUNCTIONS: ReadonlySet<string> = new Set(['ease-in-out', 'ease-in', 'ease-out', 'linear']);
+const VALID_SOUND_EFFECT_TYPES: ReadonlySet<string> = new Set(['text-appear', 'zoom', 'transition', 'whoosh', 'pop']);
+
+// Markdown code fences Gemini sometimes wraps around the JSON plan
+const CODE_FENCE_OPEN = /^```(?:json)?\s*/;
+const CODE_FENCE_CLOSE = /\s*```$/;
+
 export interface TranscriptSegment {
   start: number;
   end: number;
@@ -497,10 +507,8 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
     let jsonText = text.trim();
 
     // Remove markdown code blocks if present
-    if (jsonText.startsWith('```json')) {
-      jsonText = jsonText.replace(/^```json\s*/, '').replace(/\s*```$/, '');
-    } else if (jsonText.startsWith('```')) {
-      jsonText = jsonText.replace(/^```\s*/, '').replace(/\s*```$/, '');
+    if (jsonText.startsWith('```')) {
+      jsonText = jsonText.replace(CODE_FENCE_OPEN, '').replace(CODE_FENCE_CLOSE, '');
     }
 
     try {
@@ -558,7 +566,7 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
           `Invalid highlight: start time (${highlight.startTime}s) >= end time (${highlight.endTime}s)`
         );
       }
-      if (!['zoom', 'highlight-box', 'text-overlay'].includes(highlight.effectType)) {
+      if (!VALID_HIGHLIGHT_EFFECT_TYPES.has(highlight.effectType)) {
         throw new Error(`Invalid highlight effect type: ${highlight.effectType}`);
       }
     }
@@ -592,7 +600,7 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
       if (transition.duration <= 0) {
         throw new Error(`Invalid transition duration: ${transition.duration}s`);
       }
-      if (!['fade', 'slide', 'wipe'].includes(transition.type)) {
+      if (!VALID_TRANSITION_TYPES.has(transition.type)) {
         throw new Error(`Invalid transition type: ${transition.type}`);
       }
     }
@@ -667,7 +675,7 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
         });
         zoom.zoomDuration = 400;
       }
-      if (!['ease-in-out', 'ease-in', 'ease-out', 'linear'].includes(zoom.easingFunction)) {
+      if (!VALID_EASING_FUNCTIONS.has(zoom.easingFunction)) {
         throw new Error(`Invalid zoom easing function: ${zoom.easingFunction}`);
       }
       // Prefer ease-in-out for smooth motion
@@ -680,14 +688,18 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
       }
     }
 
-    // Check for overlapping zoom effects
-    const overlaps = this.detectZoomOverlaps(plan.zoomEffects);
+    // Check for overlapping zoom effects on a sorted copy, so a valid plan
+    // keeps the caller's ordering
+    const overlaps = this.detectZoomOverlaps(
+      [...plan.zoomEffects].sort((a, b) => a.startTime - b.startTime)
+    );
     if (overlaps.length > 0) {
       logger.warn('Overlapping zoom effects detected', {
         overlaps: overlaps.length,
         conflicts: overlaps,
       });
-      // Resolve overlaps by adjusting timing
+      // Resolve overlaps by adjusting timing, which leaves the plan in start order
+      plan.zoomEffects.sort((a, b) => a.startTime - b.startTime);
       this.resolveZoomOverlaps(plan.zoomEffects);
     }
 
@@ -698,7 +710,7 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
           `Invalid sound effect timestamp: ${sfx.timestamp}s (video duration: ${videoDuration}s)`
         );
       }
-      if (!['text-appear', 'zoom', 'transition', 'whoosh', 'pop'].includes(sfx.effectType)) {
+      if (!VALID_SOUND_EFFECT_TYPES.has(sfx.effectType)) {
         throw new Error(`Invalid sound effect type: ${sfx.effectType}`);
       }
       if (sfx.volume < 0 || sfx.volume > 1) {
@@ -741,27 +753,29 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
     for (let i = 0; i < sortedTextHighlights.length - 1; i++) {
       const current = sortedTextHighlights[i];
       const next = sortedTextHighlights[i + 1];
-      const gap = next.startTime - (current.startTime + current.duration);
+      const currentEnd = current.startTime + current.duration;
+      const gap = next.startTime - currentEnd;
       if (gap < 0.5) {
         logger.warn('Text highlight gap too small, adjusting', {
-          currentEnd: current.startTime + current.duration,
+          currentEnd,
           nextStart: next.startTime,
           gap,
           minGap: 0.5,
         });
         // Adjust next highlight start time
-        next.startTime = current.startTime + current.duration + 0.5;
+        next.startTime = currentEnd + 0.5;
       }
     }
 
     // Validate transition duration bounds (300-500ms)
     for (const transition of plan.transitions) {
       if (transition.duration < 300 || transition.duration > 500) {
+        const adjusted = Math.max(300, Math.min(500, transition.duration));
         logger.warn('Transition duration adjusted to valid range', {
           original: transition.duration,
-          adjusted: Math.max(300, Math.min(500, transition.duration)),
+          adjusted,
         });
-        transition.duration = Math.max(300, Math.min(500, transition.duration));
+        transition.duration = adjusted;
       }
     }
 
@@ -808,14 +822,21 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
 
   /**
    * Detect overlapping zoom effects
+   * Expects effects sorted by start time
    */
   private detectZoomOverlaps(zoomEffects: ZoomEffect[]): Array<{ effect1: string; effect2: string; overlapDuration: number }> {
     const overlaps: Array<{ effect1: string; effect2: string; overlapDuration: number }> = [];
 
+    // Sweep in start order so each effect is only compared with effects that
+    // start before it ends, instead of every other effect
     for (let i = 0; i < zoomEffects.length; i++) {
+      const zoom1 = zoomEffects[i];
+
       for (let j = i + 1; j < zoomEffects.length; j++) {
-        const zoom1 = zoomEffects[i];
         const zoom2 = zoomEffects[j];
+        if (zoom2.startTime >= zoom1.endTime) {
+          break; // No later effect can overlap zoom1
+        }
 
         // Check if time ranges overlap
         const overlap = this.calculateOverlap(
@@ -856,9 +877,7 @@ Return ONLY the JSON object, no additional text or markdown formatting.`;
    * Resolve overlapping zoom effects by adjusting timing
    */
   private resolveZoomOverlaps(zoomEffects: ZoomEffect[]): void {
-    // Sort by start time
-    zoomEffects.sort((a, b) => a.startTime - b.startTime);
-
+    // Effects are sorted by start time in validatePlan before resolution
     for (let i = 0; i < zoomEffects.length - 1; i++) {
       const current = zoomEffects[i];
       const next = zoomEffects[i + 1];
@@ -234,6 +234,20 @@ This is VERY IMPORTANT and you must REMEMBER this.
       );
       expect(keywordHighlight).toBeDefined();
     });
+
+    it('should use already-parsed segments without reading the SRT file', async () => {
+      // No file is written, so reading testSRTPath would fail
+      const segments = [
+        { start: 0, end: 5, text: 'A normal sentence.' },
+        { start: 5, end: 10, text: 'This is an important breakthrough!' },
+      ];
+
+      const highlights = await service.detectHighlights(testSRTPath, segments);
+
+      expect(highlights).toHaveLength(1);
+      expect(highlights[0].startTime).toBe(5);
+      expect(highlights[0].endTime).toBe(10);
+    });
   });
 
   describe('searchHighlights', () => {
@@ -325,4 +339,49 @@ This is about birds.
       expect(highlightText).not.toContain('birds');
     });
   });
+
+  describe('parseSRT cache', () => {
+    const catsSRT = `1
+00:00:00,000 --> 00:00:05,000
+This is about cats.
+`;
+    // Same byte length as catsSRT, so only the mtime tells them apart
+    const dogsSRT = catsSRT.replace('cats', 'dogs');
+
+    it('should reuse parsed segments while the file is unchanged', async () => {
+      await fs.writeFile(testSRTPath, catsSRT, 'utf-8');
+
+      const first = await (service as any).parseSRT(testSRTPath);
+      const second = await (service as any).parseSRT(testSRTPath);
+
+      expect(second).toBe(first);
+    });
+
+    it('should re-parse when the modification time changes', async () => {
+      await fs.writeFile(testSRTPath, catsSRT, 'utf-8');
+      await fs.utimes(testSRTPath, new Date(1000000), new Date(1000000));
+      const first = await (service as any).parseSRT(testSRTPath);
+
+      await fs.writeFile(testSRTPath, dogsSRT, 'utf-8');
+      await fs.utimes(testSRTPath, new Date(2000000), new Date(2000000));
+      const second = await (service as any).parseSRT(testSRTPath);
+
+      expect(first[0].text).toBe('This is about cats.');
+      expect(second[0].text).toBe('This is about dogs.');
+    });
+
+    it('should re-parse when the file size changes', async () => {
+      const mtime = new Date(1000000);
+      await fs.writeFile(testSRTPath, catsSRT, 'utf-8');
+      await fs.utimes(testSRTPath, mtime, mtime);
+      const first = await (service as any).parseSRT(testSRTPath);
+
+      await fs.writeFile(testSRTPath, catsSRT.replace('cats', 'big cats'), 'utf-8');
+      await fs.utimes(testSRTPath, mtime, mtime);
+      const second = await (service as any).parseSRT(testSRTPath);
+
+      expect(first[0].text).toBe('This is about cats.');
+      expect(second[0].text).toBe('This is about big cats.');
+    });
+  });
 });
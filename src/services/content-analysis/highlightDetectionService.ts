@@ -6,6 +6,20 @@ import { ProcessingError } from '../../utils/errors';
 
 const logger = createLogger('HighlightDetectionService');
 
+// Output and SRT patterns, compiled once at module load rather than per line
+const VIDEOGREP_LINE = /\[(\d+\.?\d*)\s*-\s*(\d+\.?\d*)\]\s*(.+)/;
+const SRT_BLOCK_SEPARATOR = /\n\s*\n/;
+const SRT_TIMESTAMP_LINE = /(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/;
+const SRT_EXTENSION = /\.srt$/;
+const REGEXP_SPECIAL_CHARS = /[.*+?^${}()|[\]\\]/g;
+
+/**
+ * Escape a literal string for use inside a RegExp
+ */
+function escapeRegExp(value: string): string {
+  return value.replace(REGEXP_SPECIAL_CHARS, '\\$&');
+}
+
 export interface Highlight {
   startTime: number;
   endTime: number;
@@ -39,6 +53,13 @@ export class HighlightDetectionService {
     'solution',
   ];
 
+  // Parsed SRT files keyed by path, reused while the file is unchanged
+  private readonly srtCache = new Map<string, { mtimeMs: number; size: number; segments: TranscriptSegment[] }>();
+  private readonly maxSrtCacheEntries = 32;
+
+  // Lowercased segment text per parsed segment list, reused across searches
+  private readonly lowerTextCache = new WeakMap<TranscriptSegment[], string[]>();
+
   /**
    * Run videogrep command with --search and --demo flags
    */
@@ -99,7 +120,12 @@ export class HighlightDetectionService {
     const lines = output.split('\n');
 
     for (const line of lines) {
-      const match = line.match(/\[(\d+\.?\d*)\s*-\s*(\d+\.?\d*)\]\s*(.+)/);
+      // Cheap substring check first; most demo output lines are not timestamps
+      if (!line.includes('[')) {
+        continue;
+      }
+
+      const match = line.match(VIDEOGREP_LINE);
 
       if (match) {
         const startTime = parseFloat(match[1]);
@@ -120,8 +146,9 @@ export class HighlightDetectionService {
 
   /**
    * Detect highlights using videogrep --search with default terms
+   * Pass the already-parsed transcript as segments to skip re-reading srtPath
    */
-  async detectHighlights(srtPath: string): Promise<Highlight[]> {
+  async detectHighlights(srtPath: string, segments?: TranscriptSegment[]): Promise<Highlight[]> {
     const jobId = path.basename(srtPath, path.extname(srtPath));
 
     logger.info('Starting highlight detection with videogrep', {
@@ -132,7 +159,7 @@ export class HighlightDetectionService {
 
     try {
       // videogrep requires video file (not just SRT)
-      const videoPath = srtPath.replace(/\.srt$/, '.mp4');
+      const videoPath = srtPath.replace(SRT_EXTENSION, '.mp4');
 
       // Check if video file exists
       try {
@@ -142,7 +169,7 @@ export class HighlightDetectionService {
           jobId,
           videoPath,
         });
-        return await this.fallbackSRTSearch(srtPath, this.defaultSearchTerms);
+        return await this.fallbackSRTSearch(srtPath, this.defaultSearchTerms, segments);
       }
 
       // Run videogrep CLI
@@ -155,10 +182,9 @@ export class HighlightDetectionService {
       const mergedHighlights = this.mergeAdjacentHighlights(highlights);
 
       // Validate
-      const segments = await this.parseSRT(srtPath);
       const validatedHighlights = this.validateHighlights(
         mergedHighlights,
-        segments
+        segments ?? (await this.parseSRT(srtPath))
       );
 
       logger.info('Highlight detection completed', {
@@ -191,9 +217,16 @@ export class HighlightDetectionService {
    */
   private async fallbackSRTSearch(
     srtPath: string,
-    searchTerms: string[]
+    searchTerms: string[],
+    parsedSegments?: TranscriptSegment[]
   ): Promise<Highlight[]> {
-    const segments = await this.parseSRT(srtPath);
+    // Without terms nothing can match, so skip parsing and scanning the transcript
+    // (an empty alternation would otherwise send every segment to the per-term loop)
+    if (searchTerms.length === 0) {
+      return [];
+    }
+
+    const segments = parsedSegments ?? (await this.parseSRT(srtPath));
 
     if (segments.length === 0) {
       return [];
@@ -201,13 +234,26 @@ export class HighlightDetectionService {
 
     const highlights: Highlight[] = [];
 
-    for (const segment of segments) {
-      const text = segment.text.toLowerCase();
+    // Lowercase the terms once instead of once per segment
+    const lowerTerms = searchTerms.map((term) => term.toLowerCase());
+
+    // A single alternation scan rejects segments containing none of the terms,
+    // so only segments with at least one hit pay for the per-term checks
+    const anyTerm = new RegExp(lowerTerms.map(escapeRegExp).join('|'));
+    const lowerTexts = this.getLowerTexts(segments);
+
+    for (let s = 0; s < segments.length; s++) {
+      const segment = segments[s];
+      const text = lowerTexts[s];
+      if (!anyTerm.test(text)) {
+        continue;
+      }
+
       const matched: string[] = [];
 
-      for (const term of searchTerms) {
-        if (text.includes(term.toLowerCase())) {
-          matched.push(term);
+      for (let i = 0; i < searchTerms.length; i++) {
+        if (text.includes(lowerTerms[i])) {
+          matched.push(searchTerms[i]);
         }
       }
 
@@ -247,7 +293,7 @@ export class HighlightDetectionService {
         typeof t === 'string' ? t : t.source
       );
 
-      const videoPath = srtPath.replace(/\.srt$/, '.mp4');
+      const videoPath = srtPath.replace(SRT_EXTENSION, '.mp4');
 
       try {
         await fs.access(videoPath);
@@ -305,9 +351,22 @@ export class HighlightDetectionService {
       return [];
     }
 
-    const sorted = [...highlights].sort((a, b) => a.startTime - b.startTime);
+    // Highlights usually arrive in transcript order already; only copy and
+    // sort when they don't
+    let inOrder = true;
+    for (let i = 1; i < highlights.length; i++) {
+      if (highlights[i].startTime < highlights[i - 1].startTime) {
+        inOrder = false;
+        break;
+      }
+    }
+    const sorted = inOrder
+      ? highlights
+      : [...highlights].sort((a, b) => a.startTime - b.startTime);
     const merged: Highlight[] = [];
     let current = { ...sorted[0] };
+    // Collect reasons for the current run and join them once it is flushed
+    let reasons = [current.reason];
 
     for (let i = 1; i < sorted.length; i++) {
       const next = sorted[i];
@@ -316,13 +375,16 @@ export class HighlightDetectionService {
       if (next.startTime - current.endTime <= 2.0) {
         current.endTime = next.endTime;
         current.confidence = Math.max(current.confidence, next.confidence);
-        current.reason += `; ${next.reason}`;
+        reasons.push(next.reason);
       } else {
+        current.reason = reasons.join('; ');
         merged.push(current);
         current = { ...next };
+        reasons = [current.reason];
       }
     }
 
+    current.reason = reasons.join('; ');
     merged.push(current);
     return merged;
   }
@@ -338,8 +400,13 @@ export class HighlightDetectionService {
       return [];
     }
 
-    // Get video duration from last segment
-    const videoDuration = Math.max(...segments.map(s => s.end));
+    // Get video duration from the latest segment end (single pass, no spread)
+    let videoDuration = -Infinity;
+    for (const segment of segments) {
+      if (segment.end > videoDuration) {
+        videoDuration = segment.end;
+      }
+    }
 
     const validated = highlights.filter(highlight => {
       // Check that start < end
@@ -385,11 +452,17 @@ export class HighlightDetectionService {
    * Parse SRT file to extract segments
    */
   private async parseSRT(srtPath: string): Promise<TranscriptSegment[]> {
+    const stats = await fs.stat(srtPath);
+    const cached = this.srtCache.get(srtPath);
+    if (cached && cached.mtimeMs === stats.mtimeMs && cached.size === stats.size) {
+      return cached.segments;
+    }
+
     const content = await fs.readFile(srtPath, 'utf-8');
     const segments: TranscriptSegment[] = [];
     
     // Split by double newline to get each subtitle block
-    const blocks = content.trim().split(/\n\s*\n/);
+    const blocks = content.trim().split(SRT_BLOCK_SEPARATOR);
     
     for (const block of blocks) {
       const lines = block.trim().split('\n');
@@ -403,18 +476,18 @@ export class HighlightDetectionService {
       // Line 2+: text
       
       const timestampLine = lines[1];
-      const timestampMatch = timestampLine.match(
-        /(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/
-      );
+      const timestampMatch = timestampLine.match(SRT_TIMESTAMP_LINE);
       
       if (!timestampMatch) {
         logger.warn('Invalid timestamp format', { timestampLine });
         continue;
       }
       
-      const startSeconds = this.parseSRTTimestamp(timestampMatch.slice(1, 5));
-      const endSeconds = this.parseSRTTimestamp(timestampMatch.slice(5, 9));
-      const text = lines.slice(2).join(' ').trim();
+      // Read the capture groups in place rather than slicing them into new arrays
+      const startSeconds = this.parseSRTTimestamp(timestampMatch, 1);
+      const endSeconds = this.parseSRTTimestamp(timestampMatch, 5);
+      // Join only multi-line text; the usual single line is used as is
+      const text = (lines.length === 3 ? lines[2] : lines.slice(2).join(' ')).trim();
       
       segments.push({
         start: startSeconds,
@@ -427,18 +500,41 @@ export class HighlightDetectionService {
       srtPath,
       segmentCount: segments.length,
     });
+
+    // Evict the oldest entry once the cache is full (Map keeps insertion order)
+    this.srtCache.delete(srtPath);
+    if (this.srtCache.size >= this.maxSrtCacheEntries) {
+      const oldest = this.srtCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.srtCache.delete(oldest);
+      }
+    }
+    this.srtCache.set(srtPath, { mtimeMs: stats.mtimeMs, size: stats.size, segments });
     
     return segments;
   }
 
+  /**
+   * Get lowercased text for each segment, computed once per segment list
+   */
+  private getLowerTexts(segments: TranscriptSegment[]): string[] {
+    let lowerTexts = this.lowerTextCache.get(segments);
+    if (!lowerTexts) {
+      lowerTexts = segments.map((segment) => segment.text.toLowerCase());
+      this.lowerTextCache.set(segments, lowerTexts);
+    }
+    return lowerTexts;
+  }
+
   /**
    * Parse SRT timestamp to seconds
+   * Reads hours, minutes, seconds and milliseconds starting at `offset`
    */
-  private parseSRTTimestamp(parts: string[]): number {
-    const hours = parseInt(parts[0], 10);
-    const minutes = parseInt(parts[1], 10);
-    const seconds = parseInt(parts[2], 10);
-    const milliseconds = parseInt(parts[3], 10);
+  private parseSRTTimestamp(parts: ArrayLike<string>, offset: number = 0): number {
+    const hours = parseInt(parts[offset], 10);
+    const minutes = parseInt(parts[offset + 1], 10);
+    const seconds = parseInt(parts[offset + 2], 10);
+    const milliseconds = parseInt(parts[offset + 3], 10);
     
     return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000;
   }
@@ -1,4 +1,4 @@
-import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
 import axios from 'axios';
 import fs from 'fs/promises';
 import brollService from './brollService';
@@ -263,4 +263,47 @@ describe('BrollService', () => {
       expect(result).toEqual([]);
     });
   });
+
+  describe('downloadMultipleVideos', () => {
+    afterEach(() => {
+      vi.restoreAllMocks();
+    });
+
+    it('should stop downloading once the target duration is reached', async () => {
+      const videos = Array.from({ length: 12 }, (_, i) => ({
+        id: `pexels-${i}`,
+        url: `https://example.com/video${i}.mp4`,
+        duration: 10,
+        width: 1920,
+        height: 1080,
+        provider: 'pexels' as const,
+      }));
+
+      vi.spyOn(brollService, 'searchVideos').mockResolvedValue({
+        videos,
+        totalFound: videos.length,
+      });
+
+      let inFlight = 0;
+      let maxInFlight = 0;
+      const downloadSpy = vi
+        .spyOn(brollService, 'downloadVideo')
+        .mockImplementation(async (video) => {
+          inFlight++;
+          maxInFlight = Math.max(maxInFlight, inFlight);
+          await new Promise((resolve) => setTimeout(resolve, 0));
+          inFlight--;
+          return { video, localPath: `/tmp/${video.id}.mp4` };
+        });
+
+      const result = await brollService.downloadMultipleVideos(['nature'], {
+        targetDuration: 20,
+        maxClipDuration: 5,
+      });
+
+      expect(result).toHaveLength(4);
+      expect(downloadSpy).toHaveBeenCalledTimes(4);
+      expect(maxInFlight).toBeLessThanOrEqual(3);
+    });
+  });
 });
@@ -7,6 +7,9 @@ import { createLogger } from '../../utils/logger';
 
 const logger = createLogger('BrollService');
 
+// Each download is buffered in memory before upload, so cap how many run at once
+const MAX_CONCURRENT_DOWNLOADS = 3;
+
 export interface BrollVideo {
   id: string;
   url: string;
@@ -75,6 +78,7 @@ class BrollService {
       });
 
       const videos: BrollVideo[] = [];
+      const targetResolution = this.getTargetResolution(orientation);
       
       if (response.data.videos) {
         for (const video of response.data.videos) {
@@ -84,7 +88,6 @@ class BrollService {
           }
 
           // Find best quality video file matching orientation
-          const targetResolution = this.getTargetResolution(orientation);
           const videoFile = this.findBestVideoFile(
             video.video_files,
             targetResolution
@@ -198,19 +201,28 @@ class BrollService {
     const downloadedVideos: BrollDownloadResult[] = [];
     let totalDuration = 0;
 
-    // Search for videos from all terms
-    for (const term of searchTerms) {
-      try {
-        const result = await this.searchVideos(term, {
-          minDuration: maxClipDuration,
-          orientation,
-          perPage: 20,
-        });
+    // Search for videos from all terms in a single batch. Placements often
+    // repeat a term, and a repeated query only returns videos that
+    // deduplication drops, so each distinct term is searched once
+    const uniqueTerms = [...new Set(searchTerms)];
+    const searchResults = await Promise.all(
+      uniqueTerms.map(async (term) => {
+        try {
+          const result = await this.searchVideos(term, {
+            minDuration: maxClipDuration,
+            orientation,
+            perPage: 20,
+          });
+          return result.videos;
+        } catch (error) {
+          logger.warn(`Failed to search for "${term}": ${error}`);
+          return [];
+        }
+      })
+    );
 
-        allVideos.push(...result.videos);
-      } catch (error) {
-        logger.warn(`Failed to search for "${term}": ${error}`);
-      }
+    for (const videos of searchResults) {
+      allVideos.push(...videos);
     }
 
     // Remove duplicates
@@ -220,27 +232,47 @@ class BrollService {
       `Found ${uniqueVideos.length} unique videos, need ${targetDuration}s total`
     );
 
-    // Download videos until we have enough duration
-    for (let i = 0; i < uniqueVideos.length; i++) {
-      const video = uniqueVideos[i];
-      if (totalDuration >= targetDuration) {
-        break;
-      }
+    // Download videos in batches until we have enough duration. Each clip
+    // contributes at most maxClipDuration, so size every batch from the
+    // remaining duration to avoid downloading more than the sequential loop would,
+    // and never run more than MAX_CONCURRENT_DOWNLOADS at once
+    let nextIndex = 0;
+    while (totalDuration < targetDuration && nextIndex < uniqueVideos.length) {
+      const clipsNeeded = Math.min(
+        MAX_CONCURRENT_DOWNLOADS,
+        Math.max(1, Math.ceil((targetDuration - totalDuration) / maxClipDuration))
+      );
+      const batchStart = nextIndex;
+      const batch = uniqueVideos.slice(batchStart, batchStart + clipsNeeded);
+      nextIndex += batch.length;
+
+      const results = await Promise.all(
+        batch.map(async (video, offset) => {
+          try {
+            const searchTerm = searchTerms[(batchStart + offset) % searchTerms.length] || '';
+            return await this.downloadVideo(video, searchTerm);
+          } catch (error) {
+            logger.warn(`Failed to download video ${video.id}: ${error}`);
+            return null;
+          }
+        })
+      );
+
+      for (let i = 0; i < batch.length; i++) {
+        const result = results[i];
+        if (!result) {
+          continue;
+        }
 
-      try {
-        const searchTerm = searchTerms[i % searchTerms.length] || '';
-        const result = await this.downloadVideo(video, searchTerm);
         downloadedVideos.push(result);
 
-        const clipDuration = Math.min(maxClipDuration, video.duration);
+        const clipDuration = Math.min(maxClipDuration, batch[i].duration);
         totalDuration += clipDuration;
-
-        logger.info(
-          `Downloaded ${downloadedVideos.length} videos, total: ${totalDuration.toFixed(1)}s / ${targetDuration}s`
-        );
-      } catch (error) {
-        logger.warn(`Failed to download video ${video.id}: ${error}`);
       }
+
+      logger.info(
+        `Downloaded ${downloadedVideos.length} videos, total: ${totalDuration.toFixed(1)}s / ${targetDuration}s`
+      );
     }
 
     if (downloadedVideos.length === 0) {
@@ -313,7 +345,13 @@ class BrollService {
     videoFiles: any[],
     targetResolution: { width: number; height: number }
   ): any | null {
-    // First try exact match
+    // Single pass: an exact match wins outright, otherwise keep the closest
+    // aspect ratio among files that are wide enough
+    const targetRatio = targetResolution.width / targetResolution.height;
+    const minWidth = targetResolution.width * 0.8;
+    let bestFile = null;
+    let smallestDiff = Infinity;
+
     for (const file of videoFiles) {
       if (
         file.width === targetResolution.width &&
@@ -321,18 +359,14 @@ class BrollService {
       ) {
         return file;
       }
-    }
 
-    // Then try closest match with same aspect ratio
-    const targetRatio = targetResolution.width / targetResolution.height;
-    let bestFile = null;
-    let smallestDiff = Infinity;
-
-    for (const file of videoFiles) {
-      const fileRatio = file.width / file.height;
-      const ratioDiff = Math.abs(fileRatio - targetRatio);
+      // Skip the ratio calculation for files that can never be selected
+      if (file.width < minWidth) {
+        continue;
+      }
 
-      if (ratioDiff < smallestDiff && file.width >= targetResolution.width * 0.8) {
+      const ratioDiff = Math.abs(file.width / file.height - targetRatio);
+      if (ratioDiff < smallestDiff) {
         smallestDiff = ratioDiff;
         bestFile = file;
       }
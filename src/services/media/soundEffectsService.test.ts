@@ -1,6 +1,9 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
 import soundEffectsService from './soundEffectsService';
-import type { SoundEffectCategory, AudioTrack } from './soundEffectsService';
+import type { SoundEffectCategory, AudioTrack, SoundEffect } from './soundEffectsService';
 
 describe('SoundEffectsService', () => {
   describe('calculateRecommendedVolume', () => {
@@ -141,4 +144,55 @@ describe('SoundEffectsService', () => {
       }
     });
   });
+
+  describe('getSoundEffectForCategory', () => {
+    const effect: SoundEffect = {
+      id: 'pixabay-1',
+      url: 'https://example.com/whoosh.mp3',
+      duration: 1,
+      category: 'whoosh',
+      volumeLevel: 0.25,
+      name: 'Whoosh',
+      provider: 'pixabay',
+    };
+    let localPath: string;
+
+    beforeEach(async () => {
+      localPath = path.join(os.tmpdir(), `sfx-test-${Date.now()}.mp3`);
+      await fs.writeFile(localPath, 'audio');
+      (soundEffectsService as any).categoryIndex.delete('whoosh');
+    });
+
+    afterEach(async () => {
+      vi.restoreAllMocks();
+      await fs.rm(localPath, { force: true });
+    });
+
+    it('should fetch again when the cached file disappears between calls', async () => {
+      const service = soundEffectsService as any;
+      vi.spyOn(service, 'searchSoundEffect').mockResolvedValue({
+        effects: [effect],
+        totalFound: 1,
+      });
+      const downloadSpy = vi
+        .spyOn(service, 'downloadSoundEffect')
+        .mockImplementation(async () => ({ localPath, effect }));
+
+      await soundEffectsService.getSoundEffectForCategory('whoosh');
+      await soundEffectsService.getSoundEffectForCategory('whoosh');
+      expect(downloadSpy).toHaveBeenCalledTimes(1);
+
+      await fs.unlink(localPath);
+      // Recreate the file only once the next download is requested
+      downloadSpy.mockImplementationOnce(async () => {
+        await fs.writeFile(localPath, 'audio');
+        return { localPath, effect };
+      });
+
+      const result = await soundEffectsService.getSoundEffectForCategory('whoosh');
+
+      expect(downloadSpy).toHaveBeenCalledTimes(2);
+      expect(result.localPath).toBe(localPath);
+    });
+  });
 });
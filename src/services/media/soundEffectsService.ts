@@ -56,6 +56,9 @@ class SoundEffectsService {
     'text-appear': ['notification', 'ding', 'chime', 'bell'],
   };
 
+  // Resolved sound effect per category, so repeat requests skip the Pixabay search
+  private readonly categoryIndex = new Map<SoundEffectCategory, SoundEffectDownloadResult>();
+
   constructor() {
     this.pixabayApiKey = config.soundEffects.apiKey;
     this.cacheDir = path.join(config.storage.cacheDir, 'sfx');
@@ -228,6 +231,20 @@ class SoundEffectsService {
     category: SoundEffectCategory,
     duration: number = 1.0
   ): Promise<SoundEffectDownloadResult> {
+    const indexed = this.categoryIndex.get(category);
+    if (indexed) {
+      // The cached file can be removed outside clearCache (temp cleanup, another
+      // process), so only reuse it while it is still on disk and non-empty
+      try {
+        if ((await fs.stat(indexed.localPath)).size > 0) {
+          return indexed;
+        }
+      } catch {
+        // File is gone; fall through and fetch it again
+      }
+      this.categoryIndex.delete(category);
+    }
+
     try {
       // Search for sound effects
       const searchResult = await this.searchSoundEffect(category, duration, {
@@ -242,7 +259,9 @@ class SoundEffectsService {
       const effect = searchResult.effects[0];
 
       // Download and cache it
-      return await this.downloadSoundEffect(effect);
+      const result = await this.downloadSoundEffect(effect);
+      this.categoryIndex.set(category, result);
+      return result;
     } catch (error) {
       logger.error(`Failed to get sound effect for ${category}: ${error}`);
       throw error;
@@ -257,13 +276,26 @@ class SoundEffectsService {
   ): Promise<Map<SoundEffectCategory, SoundEffectDownloadResult>> {
     const results = new Map<SoundEffectCategory, SoundEffectDownloadResult>();
 
-    for (const category of categories) {
-      try {
-        const result = await this.getSoundEffectForCategory(category);
-        results.set(category, result);
-        logger.info(`Downloaded sound effect for ${category}: ${result.localPath}`);
-      } catch (error) {
-        logger.warn(`Failed to download sound effect for ${category}: ${error}`);
+    // Fetch each distinct category once, all in a single concurrent batch
+    // instead of waiting on one search and download after another
+    const uniqueCategories = [...new Set(categories)];
+    const downloads = await Promise.all(
+      uniqueCategories.map(async (category) => {
+        try {
+          const result = await this.getSoundEffectForCategory(category);
+          logger.info(`Downloaded sound effect for ${category}: ${result.localPath}`);
+          return result;
+        } catch (error) {
+          logger.warn(`Failed to download sound effect for ${category}: ${error}`);
+          return null;
+        }
+      })
+    );
+
+    for (let i = 0; i < uniqueCategories.length; i++) {
+      const result = downloads[i];
+      if (result) {
+        results.set(uniqueCategories[i], result);
       }
     }
 
@@ -276,22 +308,24 @@ class SoundEffectsService {
   private async getCachedSoundPath(url: string): Promise<string | null> {
     const urlHash = this.hashUrl(url);
     
-    // Check all possible category prefixes
-    for (const category of Object.keys(this.categorySearchTerms)) {
-      const filename = `sfx-${category}-${urlHash}.mp3`;
-      const cachedPath = path.join(this.cacheDir, filename);
-
-      try {
-        const stats = await fs.stat(cachedPath);
-        if (stats.size > 0) {
-          return cachedPath;
+    // Check all possible category prefixes at once
+    const candidates = Object.keys(this.categorySearchTerms).map((category) =>
+      path.join(this.cacheDir, `sfx-${category}-${urlHash}.mp3`)
+    );
+
+    const sizes = await Promise.all(
+      candidates.map(async (cachedPath) => {
+        try {
+          return (await fs.stat(cachedPath)).size;
+        } catch {
+          return 0; // File doesn't exist
         }
-      } catch {
-        // File doesn't exist, continue
-      }
-    }
+      })
+    );
 
-    return null;
+    // Preserve category order when more than one candidate exists
+    const index = sizes.findIndex((size) => size > 0);
+    return index === -1 ? null : candidates[index];
   }
 
   /**
@@ -307,21 +341,21 @@ class SoundEffectsService {
    */
   async clearCache(category?: SoundEffectCategory): Promise<void> {
     try {
-      const files = await fs.readdir(this.cacheDir);
-      
-      for (const file of files) {
-        if (category) {
-          // Only delete files for specific category
-          if (file.startsWith(`sfx-${category}-`)) {
-            await fs.unlink(path.join(this.cacheDir, file));
-            logger.info(`Deleted cached sound effect: ${file}`);
-          }
-        } else {
-          // Delete all sound effect files
-          if (file.startsWith('sfx-')) {
-            await fs.unlink(path.join(this.cacheDir, file));
-            logger.info(`Deleted cached sound effect: ${file}`);
-          }
+      // Only delete files for specific category, or all sound effect files
+      const prefix = category ? `sfx-${category}-` : 'sfx-';
+
+      if (category) {
+        this.categoryIndex.delete(category);
+      } else {
+        this.categoryIndex.clear();
+      }
+
+      // Iterate directory entries lazily instead of materializing the listing
+      const dir = await fs.opendir(this.cacheDir);
+      for await (const entry of dir) {
+        if (entry.name.startsWith(prefix)) {
+          await fs.unlink(path.join(this.cacheDir, entry.name));
+          logger.info(`Deleted cached sound effect: ${entry.name}`);
         }
       }
 
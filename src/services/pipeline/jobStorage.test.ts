@@ -91,4 +91,16 @@ describe('Job Storage Service', () => {
     expect(userJobs.length).toBeGreaterThanOrEqual(2);
     expect(userJobs.every(job => job.userId === 'user-7')).toBe(true);
   });
+
+  it('should move a re-created job to its new user', async () => {
+    await jobStorage.createJob('job-10', 'user-10', mockMetadata);
+    await jobStorage.createJob('job-10', 'user-11', mockMetadata);
+
+    const previousUserJobs = await jobStorage.getJobsByUser('user-10');
+    const newUserJobs = await jobStorage.getJobsByUser('user-11');
+
+    expect(previousUserJobs.map(job => job.id)).not.toContain('job-10');
+    expect(newUserJobs.map(job => job.id)).toEqual(['job-10']);
+    expect(newUserJobs[0].userId).toBe('user-11');
+  });
 });
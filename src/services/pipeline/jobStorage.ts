@@ -8,7 +8,8 @@ const logger = createLogger('JobStorage');
 // For production with multiple users, consider using a database
 const jobStore = new Map<string, Job>();
 
-
+// Job IDs indexed by user ID, so per-user lookups don't scan every job
+const jobIdsByUser = new Map<string, Set<string>>();
 
 /**
  * Create a new job
@@ -28,7 +29,20 @@ export async function createJob(
     processingStages: [],
   };
 
+  // Re-creating a job under a different user moves it in the index
+  const previous = jobStore.get(id);
+  if (previous && previous.userId !== userId) {
+    jobIdsByUser.get(previous.userId)?.delete(id);
+  }
+
   jobStore.set(id, job);
+
+  let userJobIds = jobIdsByUser.get(userId);
+  if (!userJobIds) {
+    userJobIds = new Set();
+    jobIdsByUser.set(userId, userJobIds);
+  }
+  userJobIds.add(id);
   
   logger.info('Job created', {
     jobId: id,
@@ -87,10 +101,14 @@ export async function updateStage(
   let stageResult = job.processingStages.find(s => s.stage === stage);
   
   if (!stageResult) {
+    // Declare every field up front so later updates don't change the object's shape
     stageResult = {
       stage,
       status: 'pending',
       startTime: new Date(),
+      endTime: undefined,
+      outputPath: undefined,
+      error: undefined,
     };
     job.processingStages.push(stageResult);
   }
@@ -184,6 +202,12 @@ export async function getAllJobs(): Promise<Job[]> {
  * Get jobs by user ID
  */
 export async function getJobsByUser(userId: string): Promise<Job[]> {
-  const allJobs = await getAllJobs();
-  return allJobs.filter(job => job.userId === userId);
+  const jobs: Job[] = [];
+  for (const jobId of jobIdsByUser.get(userId) ?? []) {
+    const job = jobStore.get(jobId);
+    if (job) {
+      jobs.push(job);
+    }
+  }
+  return jobs;
 }
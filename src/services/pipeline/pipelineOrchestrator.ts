@@ -45,6 +45,19 @@ const PIPELINE_STAGES: PipelineStage[] = [
   'completed',
 ];
 
+/**
+ * Position of each stage in PIPELINE_STAGES, precomputed for O(1) lookups
+ */
+const STAGE_INDEX = new Map<string, number>(
+  PIPELINE_STAGES.map((stage, index) => [stage, index])
+);
+
+/**
+ * Sheets client shared by every job, so credentials are read and the JWT
+ * client is built on first use rather than once per job
+ */
+const sheetsService = new SheetsStorageService();
+
 /**
  * Handle stage error - log, update job, send notifications, and return error result
  */
@@ -113,8 +126,8 @@ async function handleStageError(
  * Returns progress with 1 decimal place precision (e.g., 45.5%)
  */
 function calculateProgress(stage: PipelineStage): number {
-  const stageIndex = PIPELINE_STAGES.indexOf(stage);
-  if (stageIndex === -1) return 0;
+  const stageIndex = STAGE_INDEX.get(stage);
+  if (stageIndex === undefined) return 0;
   
   // Calculate percentage (0-100) with 1 decimal precision
   const progress = (stageIndex / (PIPELINE_STAGES.length - 1)) * 100;
@@ -137,6 +150,31 @@ function getCurrentStage(job: Job): PipelineStage {
   return 'uploaded';
 }
 
+/**
+ * Assign downloaded B-roll clips to plan placements in a single pass
+ * Clips are reused round-robin; placements without a clip are dropped
+ */
+function assignBrollToPlacements(
+  placements: any[],
+  downloads: Array<{ localPath?: string }>
+): Array<{ startTime: number; duration: number; videoPath: string }> {
+  const assigned: Array<{ startTime: number; duration: number; videoPath: string }> = [];
+
+  for (let index = 0; index < placements.length; index++) {
+    const videoPath = downloads[index % downloads.length]?.localPath || '';
+    if (videoPath) {
+      const placement = placements[index];
+      assigned.push({
+        startTime: placement.startTime,
+        duration: placement.duration,
+        videoPath,
+      });
+    }
+  }
+
+  return assigned;
+}
+
 /**
  * Process a video through the pipeline
  * This is the main orchestration function that will be called by the worker
@@ -235,6 +273,7 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
     
     let srtPath: string;
     let transcriptSegments: any[];
+    let transcriptDuration = 0;
     try {
       const transcriptionService = new TranscriptionService();
       
@@ -248,6 +287,14 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
       const transcriptResult = await transcriptionService.transcribe(audioPath);
       srtPath = transcriptResult.srtPath;
       transcriptSegments = transcriptResult.segments;
+
+      // Video duration is the latest segment end; computed once and reused
+      // by the editing plan stage
+      for (const segment of transcriptSegments) {
+        if (segment.end > transcriptDuration) {
+          transcriptDuration = segment.end;
+        }
+      }
       
       await jobStorage.updateStage(
         jobId,
@@ -260,7 +307,7 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
         jobId,
         srtPath,
         segmentCount: transcriptSegments.length,
-        totalDuration: transcriptSegments.length > 0 ? transcriptSegments[transcriptSegments.length - 1].end : 0
+        totalDuration: transcriptDuration
       });
     } catch (error) {
       return await handleStageError(jobId, 'transcribing', error, job.userId);
@@ -271,7 +318,6 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
     await jobStorage.updateStage(jobId, 'storing-transcript', 'in-progress');
     
     try {
-      const sheetsService = new SheetsStorageService();
       logger.info('🔗 Connecting to Google Sheets...', { jobId });
       await sheetsService.initialize();
       
@@ -305,7 +351,8 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
     try {
       const highlightService = new HighlightDetectionService();
       logger.info('🔍 Analyzing transcript for highlight moments...', { jobId });
-      highlights = await highlightService.detectHighlights(srtPath);
+      // Reuse the transcript parsed during transcription instead of re-reading the SRT
+      highlights = await highlightService.detectHighlights(srtPath, transcriptSegments);
       
       await jobStorage.updateStage(
         jobId,
@@ -337,9 +384,7 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
       const editingPlanService = new EditingPlanService();
       
       // Get video duration from transcript
-      videoDuration = transcriptSegments.length > 0 
-        ? Math.max(...transcriptSegments.map((s: any) => s.end))
-        : 0;
+      videoDuration = transcriptDuration;
       
       logger.info('🤖 Sending data to AI (Gemini) for editing plan generation...', {
         jobId,
@@ -386,7 +431,13 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
     let brollVideos: any[] = [];
     try {
       if (editingPlan.brollPlacements && editingPlan.brollPlacements.length > 0) {
-        const searchTerms = editingPlan.brollPlacements.map((b: any) => b.searchTerm);
+        // Collect search terms and total duration in one pass over the placements
+        const searchTerms: string[] = [];
+        let targetDuration = 0;
+        for (const placement of editingPlan.brollPlacements) {
+          searchTerms.push(placement.searchTerm);
+          targetDuration += placement.duration;
+        }
         
         logger.info('🔍 Searching for B-roll footage...', {
           jobId,
@@ -396,16 +447,12 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
         
         try {
           const downloadedBroll = await brollService.downloadMultipleVideos(searchTerms, {
-            targetDuration: editingPlan.brollPlacements.reduce((sum: number, b: any) => sum + b.duration, 0),
+            targetDuration,
             maxClipDuration: 5,
           });
           
           // Map downloaded B-roll to placements
-          brollVideos = editingPlan.brollPlacements.map((placement: any, index: number) => ({
-            startTime: placement.startTime,
-            duration: placement.duration,
-            videoPath: downloadedBroll[index % downloadedBroll.length]?.localPath || '',
-          })).filter((b: any) => b.videoPath);
+          brollVideos = assignBrollToPlacements(editingPlan.brollPlacements, downloadedBroll);
           
           logger.info('✅ B-roll downloaded successfully', {
             jobId,
@@ -423,11 +470,7 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
           try {
             const fallbackBroll = await brollService.handleMissingBroll(searchTerms);
             if (fallbackBroll.length > 0) {
-              brollVideos = editingPlan.brollPlacements.map((placement: any, index: number) => ({
-                startTime: placement.startTime,
-                duration: placement.duration,
-                videoPath: fallbackBroll[index % fallbackBroll.length]?.localPath || '',
-              })).filter((b: any) => b.videoPath);
+              brollVideos = assignBrollToPlacements(editingPlan.brollPlacements, fallbackBroll);
               
               logger.info('✅ Fallback B-roll downloaded', {
                 jobId,
@@ -468,14 +511,12 @@ export async function processVideo(jobId: string): Promise<ProcessingResult> {
         animations: editingPlan.animations.length,
         transitions: editingPlan.transitions.length,
         brollClips: brollVideos.length,
-        subtitles: transcriptSegments.length
       });
       
       const renderResult = await remotionRenderingService.renderVideo({
         videoPath: autoEditedVideoPath,
         editingPlan,
         outputPath,
-        srtPath,
         brollVideos,
       });
       
@@ -662,8 +703,8 @@ export async function getStatus(jobId: string): Promise<JobStatus> {
  * Get next stage in pipeline
  */
 export function getNextStage(currentStage: PipelineStage): PipelineStage | null {
-  const currentIndex = PIPELINE_STAGES.indexOf(currentStage);
-  if (currentIndex === -1 || currentIndex === PIPELINE_STAGES.length - 1) {
+  const currentIndex = STAGE_INDEX.get(currentStage);
+  if (currentIndex === undefined || currentIndex === PIPELINE_STAGES.length - 1) {
     return null;
   }
   return PIPELINE_STAGES[currentIndex + 1];
@@ -673,5 +714,5 @@ export function getNextStage(currentStage: PipelineStage): PipelineStage | null
  * Check if stage is valid
  */
 export function isValidStage(stage: string): stage is PipelineStage {
-  return PIPELINE_STAGES.includes(stage as PipelineStage);
+  return STAGE_INDEX.has(stage);
 }
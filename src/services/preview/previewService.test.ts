@@ -123,4 +123,46 @@ describe('PreviewService', () => {
       expect(files.length).toBe(0);
     });
   });
+
+  describe('preview cache eviction', () => {
+    const preview = (name: string) => ({
+      previewUrl: `/previews/${name}.mp4`,
+      duration: 1,
+      thumbnailUrl: `/previews/${name}-thumb.jpg`,
+    });
+
+    it('should evict the least recently used preview once full', () => {
+      const service = previewService as any;
+      const capacity: number = service.maxPreviewCacheEntries;
+
+      for (let i = 0; i < capacity; i++) {
+        service.cachePreview(`key-${i}`, preview(`p${i}`));
+      }
+
+      // Reading key-0 makes key-1 the least recently used entry
+      expect(service.getCachedPreview('key-0')).toEqual(preview('p0'));
+
+      service.cachePreview('key-new', preview('new'));
+
+      expect(service.previewCache.size).toBe(capacity);
+      expect(service.getCachedPreview('key-1')).toBeUndefined();
+      expect(service.getCachedPreview('key-0')).toEqual(preview('p0'));
+      expect(service.getCachedPreview('key-new')).toEqual(preview('new'));
+    });
+
+    it('should not evict when replacing an existing key', () => {
+      const service = previewService as any;
+      const capacity: number = service.maxPreviewCacheEntries;
+
+      for (let i = 0; i < capacity; i++) {
+        service.cachePreview(`key-${i}`, preview(`p${i}`));
+      }
+
+      service.cachePreview('key-0', preview('updated'));
+
+      expect(service.previewCache.size).toBe(capacity);
+      expect(service.getCachedPreview('key-0')).toEqual(preview('updated'));
+      expect(service.getCachedPreview('key-1')).toEqual(preview('p1'));
+    });
+  });
 });
@@ -68,6 +68,9 @@ export interface EditingPlan {
 export class PreviewService {
   private cacheDir: string;
   private previewCache: Map<string, PreviewResult>;
+  // Previews are requested repeatedly for a handful of templates; keep the
+  // most recently used ones instead of every parameter combination ever seen
+  private readonly maxPreviewCacheEntries = 64;
 
   constructor(cacheDir: string = path.join(process.cwd(), 'temp', 'previews')) {
     this.cacheDir = cacheDir;
@@ -104,7 +107,7 @@ export class PreviewService {
 
     // Check cache
     const cacheKey = this.generateCacheKey('animation', { template, parameters });
-    const cached = this.previewCache.get(cacheKey);
+    const cached = this.getCachedPreview(cacheKey);
     if (cached) {
       logger.info('Returning cached animation preview', { template });
       return cached;
@@ -143,7 +146,7 @@ export class PreviewService {
       };
 
       // Cache the result
-      this.previewCache.set(cacheKey, result);
+      this.cachePreview(cacheKey, result);
 
       logger.info('Animation preview generated', { template, outputPath });
       return result;
@@ -175,7 +178,7 @@ export class PreviewService {
 
     // Check cache
     const cacheKey = this.generateCacheKey('transition', { type, videoSegments });
-    const cached = this.previewCache.get(cacheKey);
+    const cached = this.getCachedPreview(cacheKey);
     if (cached) {
       logger.info('Returning cached transition preview', { type });
       return cached;
@@ -213,7 +216,7 @@ export class PreviewService {
       };
 
       // Cache the result
-      this.previewCache.set(cacheKey, result);
+      this.cachePreview(cacheKey, result);
 
       logger.info('Transition preview generated', { type, outputPath });
       return result;
@@ -242,7 +245,7 @@ export class PreviewService {
 
     // Check cache
     const cacheKey = this.generateCacheKey('effect', { effect, videoPath });
-    const cached = this.previewCache.get(cacheKey);
+    const cached = this.getCachedPreview(cacheKey);
     if (cached) {
       logger.info('Returning cached effect preview', { effect: effect.type });
       return cached;
@@ -280,7 +283,7 @@ export class PreviewService {
       };
 
       // Cache the result
-      this.previewCache.set(cacheKey, result);
+      this.cachePreview(cacheKey, result);
 
       logger.info('Effect preview generated', { effect: effect.type, outputPath });
       return result;
@@ -309,7 +312,7 @@ export class PreviewService {
 
     // Check cache
     const cacheKey = this.generateCacheKey('full-video', { editingPlan, videoPath });
-    const cached = this.previewCache.get(cacheKey);
+    const cached = this.getCachedPreview(cacheKey);
     if (cached) {
       logger.info('Returning cached full video preview');
       return cached;
@@ -347,7 +350,7 @@ export class PreviewService {
       };
 
       // Cache the result
-      this.previewCache.set(cacheKey, result);
+      this.cachePreview(cacheKey, result);
 
       logger.info('Full video preview generated', { outputPath });
       return result;
@@ -375,6 +378,33 @@ export class PreviewService {
     }
   }
 
+  /**
+   * Get a cached preview and mark it as most recently used
+   */
+  private getCachedPreview(cacheKey: string): PreviewResult | undefined {
+    const cached = this.previewCache.get(cacheKey);
+    if (cached) {
+      // Re-insert so Map order tracks recency
+      this.previewCache.delete(cacheKey);
+      this.previewCache.set(cacheKey, cached);
+    }
+    return cached;
+  }
+
+  /**
+   * Cache a preview, evicting the least recently used entry once full
+   */
+  private cachePreview(cacheKey: string, result: PreviewResult): void {
+    this.previewCache.delete(cacheKey);
+    if (this.previewCache.size >= this.maxPreviewCacheEntries) {
+      const oldest = this.previewCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.previewCache.delete(oldest);
+      }
+    }
+    this.previewCache.set(cacheKey, result);
+  }
+
   /**
    * Generate cache key for preview
    */
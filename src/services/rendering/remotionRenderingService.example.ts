@@ -110,7 +110,6 @@ async function exampleRenderVideo() {
       videoPath: '/path/to/input/video.mp4',
       editingPlan,
       outputPath: '/path/to/output/final-video.mp4',
-      srtPath: '/path/to/subtitles.srt', // Optional
       brollVideos, // Optional
     });
 
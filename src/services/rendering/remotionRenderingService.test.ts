@@ -113,50 +113,6 @@ describe('RemotionRenderingService', () => {
     });
   });
 
-  describe('parseSRT', () => {
-    it('should parse valid SRT file', async () => {
-      const srtContent = `1
-00:00:01,000 --> 00:00:03,000
-First subtitle
-
-2
-00:00:03,500 --> 00:00:05,000
-Second subtitle`;
-
-      vi.mocked(fs.readFile).mockResolvedValue(srtContent);
-
-      const service = new RemotionRenderingService();
-      const result = await (service as any).parseSRT('/path/to/file.srt');
-
-      expect(result).toHaveLength(2);
-      expect(result[0]).toEqual({
-        startTime: 1.0,
-        endTime: 3.0,
-        text: 'First subtitle',
-      });
-      expect(result[1]).toEqual({
-        startTime: 3.5,
-        endTime: 5.0,
-        text: 'Second subtitle',
-      });
-    });
-
-    it('should handle multi-line subtitles', async () => {
-      const srtContent = `1
-00:00:01,000 --> 00:00:03,000
-First line
-Second line`;
-
-      vi.mocked(fs.readFile).mockResolvedValue(srtContent);
-
-      const service = new RemotionRenderingService();
-      const result = await (service as any).parseSRT('/path/to/file.srt');
-
-      expect(result).toHaveLength(1);
-      expect(result[0].text).toBe('First line Second line');
-    });
-  });
-
   describe('validateEditingPlanTimestamps', () => {
     it('should warn when animation extends beyond video duration', () => {
       const plan: EditingPlan = {
@@ -246,15 +202,10 @@ Second line`;
         duration: 10.0,
       };
 
-      const subtitles = [
-        { startTime: 1.0, endTime: 3.0, text: 'Test subtitle' },
-      ];
-
       const service = new RemotionRenderingService();
       const result = (service as any).createCompositionData(
         input,
-        videoMetadata,
-        subtitles
+        videoMetadata
       );
 
       expect(result).toEqual({
@@ -263,7 +214,6 @@ Second line`;
         videoWidth: videoMetadata.width,
         videoHeight: videoMetadata.height,
         editingPlan: input.editingPlan,
-        subtitles,
         brollVideos: [],
         soundEffectPaths: [],
       });
@@ -299,8 +249,7 @@ Second line`;
       const service = new RemotionRenderingService();
       const result = (service as any).createCompositionData(
         input,
-        videoMetadata,
-        []
+        videoMetadata
       );
 
       expect(result.brollVideos).toEqual(brollVideos);
@@ -15,7 +15,6 @@ export interface RenderInput {
   videoPath: string;
   editingPlan: EditingPlan;
   outputPath: string;
-  srtPath?: string;
   brollVideos?: BrollVideoMapping[];
   soundEffectPaths?: SoundEffectPathMapping[];
 }
@@ -42,7 +41,7 @@ export interface RenderResult {
 /**
  * Remotion Rendering Service
  * 
- * Applies animations, effects, B-roll, and subtitles to videos using Remotion
+ * Applies animations, effects, B-roll, and text highlights to videos using Remotion
  */
 export class RemotionRenderingService {
   private readonly tempDir: string;
@@ -87,16 +86,6 @@ export class RemotionRenderingService {
       // Validate editing plan timestamps
       this.validateEditingPlanTimestamps(input.editingPlan, videoMetadata.duration);
 
-      // Parse subtitles if provided
-      let subtitles: SubtitleSegment[] = [];
-      if (input.srtPath) {
-        subtitles = await this.parseSRT(input.srtPath);
-        logger.info('Subtitles parsed', {
-          jobId,
-          segments: subtitles.length,
-        });
-      }
-
       // Prepare public assets (copy videos and sound effects to accessible location)
       const publicAssets = await this.preparePublicAssets(
         jobId,
@@ -113,8 +102,7 @@ export class RemotionRenderingService {
           brollVideos: publicAssets.brollVideos,
           soundEffectPaths: publicAssets.soundEffectPaths,
         },
-        videoMetadata,
-        subtitles
+        videoMetadata
       );
 
       // Bundle Remotion project
@@ -212,15 +200,6 @@ export class RemotionRenderingService {
       throw new Error(`Video file not found: ${input.videoPath}`);
     }
 
-    // Check SRT file exists if provided
-    if (input.srtPath) {
-      try {
-        await fs.access(input.srtPath);
-      } catch {
-        throw new Error(`SRT file not found: ${input.srtPath}`);
-      }
-    }
-
     // Check B-roll videos exist if provided
     if (input.brollVideos) {
       for (const broll of input.brollVideos) {
@@ -324,58 +303,12 @@ export class RemotionRenderingService {
     }
   }
 
-  /**
-   * Parse SRT subtitle file
-   */
-  private async parseSRT(srtPath: string): Promise<SubtitleSegment[]> {
-    const content = await fs.readFile(srtPath, 'utf-8');
-    const segments: SubtitleSegment[] = [];
-
-    const blocks = content.trim().split(/\n\s*\n/);
-
-    for (const block of blocks) {
-      const lines = block.trim().split('\n');
-      if (lines.length < 3) continue;
-
-      const timeLine = lines[1];
-      const textLines = lines.slice(2);
-
-      // Parse timestamp: 00:00:01,000 --> 00:00:03,000
-      const timeMatch = timeLine.match(
-        /(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})/
-      );
-
-      if (timeMatch) {
-        const startTime =
-          parseInt(timeMatch[1]) * 3600 +
-          parseInt(timeMatch[2]) * 60 +
-          parseInt(timeMatch[3]) +
-          parseInt(timeMatch[4]) / 1000;
-
-        const endTime =
-          parseInt(timeMatch[5]) * 3600 +
-          parseInt(timeMatch[6]) * 60 +
-          parseInt(timeMatch[7]) +
-          parseInt(timeMatch[8]) / 1000;
-
-        segments.push({
-          startTime,
-          endTime,
-          text: textLines.join(' '),
-        });
-      }
-    }
-
-    return segments;
-  }
-
   /**
    * Create composition data for Remotion
    */
   private createCompositionData(
     input: RenderInput,
-    videoMetadata: VideoMetadata,
-    subtitles: SubtitleSegment[]
+    videoMetadata: VideoMetadata
   ): CompositionData {
     return {
       videoPath: input.videoPath,
@@ -383,7 +316,6 @@ export class RemotionRenderingService {
       videoWidth: videoMetadata.width,
       videoHeight: videoMetadata.height,
       editingPlan: input.editingPlan,
-      subtitles,
       brollVideos: input.brollVideos || [],
       soundEffectPaths: input.soundEffectPaths || [],
     };
@@ -431,37 +363,45 @@ export class RemotionRenderingService {
     const publicDir = path.join(this.tempDir, `public-${jobId}`);
     await fs.mkdir(publicDir, { recursive: true });
 
-    // Copy main video
+    // Copy main video, B-roll videos and sound effects concurrently
     const mainVideoName = path.basename(videoPath);
     const publicVideoPath = path.join(publicDir, mainVideoName);
-    await fs.copyFile(videoPath, publicVideoPath);
 
-    // Copy B-roll videos
-    const publicBrollVideos: BrollVideoMapping[] = [];
-    for (const broll of brollVideos) {
+    // Placements often reuse the same clip or sound, so copy each source once
+    const copies = new Map<string, Promise<void>>();
+    const copyOnce = (sourcePath: string, targetPath: string): Promise<void> => {
+      let copy = copies.get(sourcePath);
+      if (!copy) {
+        copy = fs.copyFile(sourcePath, targetPath);
+        copies.set(sourcePath, copy);
+      }
+      return copy;
+    };
+
+    const copyBroll = async (broll: BrollVideoMapping): Promise<BrollVideoMapping> => {
       const brollName = path.basename(broll.videoPath);
       const publicBrollPath = path.join(publicDir, brollName);
-      await fs.copyFile(broll.videoPath, publicBrollPath);
-      
-      publicBrollVideos.push({
+      await copyOnce(broll.videoPath, publicBrollPath);
+
+      return {
         ...broll,
         videoPath: brollName, // Use relative path
-      });
-    }
+      };
+    };
 
-    // Copy sound effects
-    const publicSoundEffects: SoundEffectPathMapping[] = [];
-    for (const sfx of soundEffectPaths) {
+    const copySoundEffect = async (
+      sfx: SoundEffectPathMapping
+    ): Promise<SoundEffectPathMapping | null> => {
       const sfxName = path.basename(sfx.localPath);
       const publicSfxPath = path.join(publicDir, sfxName);
-      
+
       try {
-        await fs.copyFile(sfx.localPath, publicSfxPath);
-        
-        publicSoundEffects.push({
+        await copyOnce(sfx.localPath, publicSfxPath);
+
+        return {
           ...sfx,
           localPath: sfxName, // Use relative path
-        });
+        };
       } catch (error) {
         logger.warn('Failed to copy sound effect, skipping', {
           jobId,
@@ -469,8 +409,19 @@ export class RemotionRenderingService {
           error: error instanceof Error ? error.message : String(error),
         });
         // Continue without this sound effect
+        return null;
       }
-    }
+    };
+
+    const [, publicBrollVideos, copiedSoundEffects] = await Promise.all([
+      copyOnce(videoPath, publicVideoPath),
+      Promise.all(brollVideos.map(copyBroll)),
+      Promise.all(soundEffectPaths.map(copySoundEffect)),
+    ]);
+
+    const publicSoundEffects = copiedSoundEffects.filter(
+      (sfx): sfx is SoundEffectPathMapping => sfx !== null
+    );
 
     return {
       publicDir,
@@ -488,19 +439,12 @@ interface VideoMetadata {
   duration: number;
 }
 
-interface SubtitleSegment {
-  startTime: number;
-  endTime: number;
-  text: string;
-}
-
 interface CompositionData {
   videoPath: string;
   videoDuration: number;
   videoWidth: number;
   videoHeight: number;
   editingPlan: EditingPlan;
-  subtitles: SubtitleSegment[];
   brollVideos: BrollVideoMapping[];
   soundEffectPaths: SoundEffectPathMapping[];
 }
@@ -143,6 +143,32 @@ describe('ZoomEffectsService', () => {
       expect(result.conflicts[0].overlapDuration).toBe(2.0); // 10.0 - 8.0
     });
 
+    it('should report conflicts in input order for unsorted effects', () => {
+      const zoom = (id: string, startTime: number, endTime: number): ZoomEffect => ({
+        id,
+        startTime,
+        endTime,
+        targetScale: 1.2,
+        easingFunction: 'ease-in-out',
+        zoomDuration: 400,
+      });
+      const effects: ZoomEffect[] = [
+        zoom('zoom-late', 8.0, 12.0),
+        zoom('zoom-separate', 20.0, 22.0),
+        zoom('zoom-early', 5.0, 10.0),
+        zoom('zoom-middle', 9.0, 11.0),
+      ];
+
+      const result = ZoomEffectsService.validateZoomTiming(effects);
+
+      expect(result.conflicts.map((c) => [c.effect1, c.effect2])).toEqual([
+        ['zoom-late', 'zoom-early'],
+        ['zoom-late', 'zoom-middle'],
+        ['zoom-early', 'zoom-middle'],
+      ]);
+      expect(result.conflicts[0].overlapDuration).toBe(2.0); // 10.0 - 8.0
+    });
+
     it('should detect multiple overlaps', () => {
       const effects: ZoomEffect[] = [
         {
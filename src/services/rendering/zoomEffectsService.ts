@@ -3,6 +3,8 @@ import { createLogger } from '../../utils/logger';
 
 const logger = createLogger('ZoomEffectsService');
 
+const VALID_EASINGS: ReadonlySet<string> = new Set(['ease-in-out', 'ease-in', 'ease-out', 'linear']);
+
 export interface ZoomConfig {
   startTime: number;
   endTime: number;
@@ -81,10 +83,21 @@ export class ZoomEffectsService {
   static validateZoomTiming(effects: ZoomEffect[]): ValidationResult {
     const conflicts: ZoomConflict[] = [];
 
-    for (let i = 0; i < effects.length; i++) {
-      for (let j = i + 1; j < effects.length; j++) {
-        const effect1 = effects[i];
-        const effect2 = effects[j];
+    // Sweep input indices in start order so each effect is only compared with
+    // effects that start before it ends, instead of every other effect
+    const order = effects
+      .map((_, index) => index)
+      .sort((a, b) => effects[a].startTime - effects[b].startTime);
+    const overlappingPairs: Array<{ first: number; second: number; overlap: number }> = [];
+
+    for (let i = 0; i < order.length; i++) {
+      const effect1 = effects[order[i]];
+
+      for (let j = i + 1; j < order.length; j++) {
+        const effect2 = effects[order[j]];
+        if (effect2.startTime >= effect1.endTime) {
+          break; // No later effect can overlap effect1
+        }
 
         // Check if time ranges overlap
         const overlap = this.calculateOverlap(
@@ -95,16 +108,26 @@ export class ZoomEffectsService {
         );
 
         if (overlap > 0) {
-          conflicts.push({
-            effect1: effect1.id,
-            effect2: effect2.id,
-            overlapDuration: overlap,
-            resolution: 'adjust-timing',
+          overlappingPairs.push({
+            first: Math.min(order[i], order[j]),
+            second: Math.max(order[i], order[j]),
+            overlap,
           });
         }
       }
     }
 
+    // Report conflicts in input order, as the pairwise scan did
+    overlappingPairs.sort((a, b) => a.first - b.first || a.second - b.second);
+    for (const { first, second, overlap } of overlappingPairs) {
+      conflicts.push({
+        effect1: effects[first].id,
+        effect2: effects[second].id,
+        overlapDuration: overlap,
+        resolution: 'adjust-timing',
+      });
+    }
+
     const isValid = conflicts.length === 0;
 
     if (!isValid) {
@@ -205,8 +228,7 @@ export class ZoomEffectsService {
       errors.push(`Zoom duration must be positive: ${effect.zoomDuration}ms`);
     }
 
-    const validEasings = ['ease-in-out', 'ease-in', 'ease-out', 'linear'];
-    if (!validEasings.includes(effect.easingFunction)) {
+    if (!VALID_EASINGS.has(effect.easingFunction)) {
       errors.push(`Invalid easing function: ${effect.easingFunction}`);
     }
 
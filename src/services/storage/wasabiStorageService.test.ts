@@ -0,0 +1,173 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { DeleteObjectCommand, DeleteObjectsCommand, ListObjectsV2Command } from '@aws-sdk/client-s3';
+import { WasabiStorageService, MediaMetadata } from './wasabiStorageService';
+
+const mockLogger = vi.hoisted(() => ({
+  info: vi.fn(),
+  warn: vi.fn(),
+  error: vi.fn(),
+  debug: vi.fn(),
+}));
+
+vi.mock('../../utils/logger', () => ({
+  createLogger: () => mockLogger,
+}));
+vi.mock('../../config', () => ({
+  config: {
+    storage: {
+      tempDir: '/tmp',
+      wasabi: {
+        bucket: 'test-bucket',
+        region: 'us-east-1',
+        accessKeyId: 'test-key',
+        secretAccessKey: 'test-secret',
+      },
+    },
+  },
+}));
+
+describe('WasabiStorageService', () => {
+  let service: any;
+  let send: ReturnType<typeof vi.fn>;
+
+  const metadata = (key: string, hash: string): MediaMetadata => ({
+    key,
+    hash,
+    size: 1000,
+    uploadedAt: new Date(),
+    category: 'broll',
+  });
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    service = new WasabiStorageService();
+    // An empty bucket listing, so any lookup that misses the cache finds nothing
+    send = vi.fn().mockResolvedValue({ Contents: [] });
+    service.s3Client = { send };
+  });
+
+  describe('findByHash', () => {
+    it('should return a cached key without listing the bucket', async () => {
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-1'));
+
+      expect(await service.findByHash('hash-1', 'broll')).toBe('broll/a.mp4');
+      expect(send).not.toHaveBeenCalled();
+    });
+
+    it('should return the first key cached for a hash', async () => {
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-1'));
+      service.cacheMetadata(metadata('broll/b.mp4', 'hash-1'));
+
+      expect(await service.findByHash('hash-1', 'broll')).toBe('broll/a.mp4');
+    });
+
+    it('should forget the old hash when a key is re-uploaded with new content', async () => {
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-1'));
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-2'));
+
+      expect(await service.findByHash('hash-2', 'broll')).toBe('broll/a.mp4');
+      expect(await service.findByHash('hash-1', 'broll')).toBeNull();
+      expect(send).toHaveBeenCalledTimes(1);
+    });
+
+    it('should fall back to another cached key with the old hash after a re-upload', async () => {
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-1'));
+      service.cacheMetadata(metadata('broll/b.mp4', 'hash-1'));
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-2'));
+
+      expect(await service.findByHash('hash-1', 'broll')).toBe('broll/b.mp4');
+      expect(await service.findByHash('hash-2', 'broll')).toBe('broll/a.mp4');
+      expect(send).not.toHaveBeenCalled();
+    });
+
+    it('should keep category lookups separate', async () => {
+      service.cacheMetadata(metadata('broll/a.mp4', 'hash-1'));
+
+      expect(await service.findByHash('hash-1', 'sfx')).toBeNull();
+    });
+  });
+
+  describe('deleteOldFiles', () => {
+    const old = new Date('2020-01-01T00:00:00Z');
+    const recent = new Date();
+
+    const listing = {
+      Contents: [
+        { Key: 'temp/old-1.mp4', LastModified: old },
+        { Key: 'temp/old-2.mp4', LastModified: old },
+        { Key: 'temp/new.mp4', LastModified: recent },
+      ],
+    };
+
+    it('should delete only expired keys in one batch request', async () => {
+      send.mockImplementation(async (command: unknown) => {
+        if (command instanceof ListObjectsV2Command) {
+          return listing;
+        }
+        return { Deleted: [{ Key: 'temp/old-1.mp4' }, { Key: 'temp/old-2.mp4' }] };
+      });
+
+      const deletedCount = await service.deleteOldFiles('temp/', 7);
+
+      expect(deletedCount).toBe(2);
+      expect(send).toHaveBeenCalledTimes(2);
+      const batch = send.mock.calls[1][0];
+      expect(batch).toBeInstanceOf(DeleteObjectsCommand);
+      expect(batch.input.Delete.Objects).toEqual([
+        { Key: 'temp/old-1.mp4' },
+        { Key: 'temp/old-2.mp4' },
+      ]);
+    });
+
+    it('should count only deleted keys and log per-key errors', async () => {
+      send.mockImplementation(async (command: unknown) => {
+        if (command instanceof ListObjectsV2Command) {
+          return listing;
+        }
+        return {
+          Deleted: [{ Key: 'temp/old-1.mp4' }],
+          Errors: [{ Key: 'temp/old-2.mp4', Code: 'AccessDenied', Message: 'Access Denied' }],
+        };
+      });
+
+      const deletedCount = await service.deleteOldFiles('temp/', 7);
+
+      expect(deletedCount).toBe(1);
+      expect(mockLogger.warn).toHaveBeenCalledWith('Failed to delete old file', {
+        key: 'temp/old-2.mp4',
+        error: 'Access Denied',
+      });
+    });
+
+    it('should not send a delete request when nothing has expired', async () => {
+      send.mockResolvedValue({
+        Contents: [{ Key: 'temp/new.mp4', LastModified: recent }],
+      });
+
+      const deletedCount = await service.deleteOldFiles('temp/', 7);
+
+      expect(deletedCount).toBe(0);
+      expect(send).toHaveBeenCalledTimes(1);
+    });
+
+    it('should fall back to per-key deletes when the batch request is rejected', async () => {
+      send.mockImplementation(async (command: unknown) => {
+        if (command instanceof ListObjectsV2Command) {
+          return listing;
+        }
+        if (command instanceof DeleteObjectsCommand) {
+          throw new Error('InvalidRequest');
+        }
+        return {};
+      });
+
+      const deletedCount = await service.deleteOldFiles('temp/', 7);
+
+      expect(deletedCount).toBe(2);
+      const singleDeletes = send.mock.calls.filter(
+        ([command]: unknown[]) => command instanceof DeleteObjectCommand
+      );
+      expect(singleDeletes).toHaveLength(2);
+    });
+  });
+});
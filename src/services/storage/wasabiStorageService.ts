@@ -1,6 +1,8 @@
-import { S3Client, PutObjectCommand, GetObjectCommand, HeadObjectCommand, DeleteObjectCommand, ListObjectsV2Command } from '@aws-sdk/client-s3';
+import { S3Client, PutObjectCommand, GetObjectCommand, HeadObjectCommand, DeleteObjectCommand, DeleteObjectsCommand, ListObjectsV2Command } from '@aws-sdk/client-s3';
 import { getSignedUrl } from '@aws-sdk/s3-request-presigner';
-import { promises as fs } from 'fs';
+import { promises as fs, createReadStream, createWriteStream } from 'fs';
+import { Readable } from 'stream';
+import { pipeline } from 'stream/promises';
 import * as path from 'path';
 import * as crypto from 'crypto';
 import { config } from '../../config';
@@ -8,6 +10,30 @@ import { createLogger } from '../../utils/logger';
 
 const logger = createLogger('WasabiStorageService');
 
+// Errors that retrying cannot fix, matched in one case-insensitive scan:
+// authentication/authorization failures and missing buckets
+const NON_RETRYABLE_ERROR =
+  /access denied|invalid access key|signature does not match|nosuchbucket|bucket not found/i;
+
+// Characters replaced with '-' when a search term becomes part of a B-roll key
+const UNSAFE_KEY_CHARS = /[^a-z0-9]/gi;
+
+// Per-key deletes allowed in flight when a batch delete request is rejected
+const MAX_CONCURRENT_DELETES = 5;
+
+// Content types by lowercase extension, built once and shared by every upload
+const CONTENT_TYPES: Readonly<Record<string, string>> = {
+  '.mp4': 'video/mp4',
+  '.mov': 'video/quicktime',
+  '.avi': 'video/x-msvideo',
+  '.mkv': 'video/x-matroska',
+  '.mp3': 'audio/mpeg',
+  '.wav': 'audio/wav',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.png': 'image/png',
+};
+
 export interface UploadResult {
   key: string;
   url: string;
@@ -32,6 +58,11 @@ export interface MediaMetadata {
   category: 'video' | 'broll' | 'sfx' | 'image';
 }
 
+interface ListedObject {
+  key: string;
+  lastModified?: Date;
+}
+
 /**
  * Wasabi Storage Service - S3-compatible object storage
  * Manages video uploads, B-roll, sound effects, and images
@@ -41,6 +72,8 @@ export class WasabiStorageService {
   private bucket: string;
   private region: string;
   private metadataCache: Map<string, MediaMetadata> = new Map();
+  // Cached keys indexed by `${category}:${hash}` so duplicate checks skip the scan
+  private keysByHash: Map<string, string> = new Map();
 
   constructor() {
     this.bucket = config.storage.wasabi.bucket;
@@ -54,6 +87,9 @@ export class WasabiStorageService {
         accessKeyId: config.storage.wasabi.accessKeyId,
         secretAccessKey: config.storage.wasabi.secretAccessKey,
       },
+      // Only add the SDK's flexible checksums where an operation requires one;
+      // S3-compatible endpoints may reject them on every request
+      requestChecksumCalculation: 'WHEN_REQUIRED',
     });
 
     logger.info('Wasabi Storage Service initialized', {
@@ -165,22 +201,7 @@ export class WasabiStorageService {
    * Check if error should not be retried
    */
   private isNonRetryableError(error: Error): boolean {
-    const message = error.message.toLowerCase();
-    
-    // Don't retry on authentication/authorization errors
-    if (message.includes('access denied') || 
-        message.includes('invalid access key') ||
-        message.includes('signature does not match')) {
-      return true;
-    }
-
-    // Don't retry on invalid bucket errors
-    if (message.includes('nosuchbucket') || 
-        message.includes('bucket not found')) {
-      return true;
-    }
-
-    return false;
+    return NON_RETRYABLE_ERROR.test(error.message);
   }
 
   /**
@@ -188,20 +209,7 @@ export class WasabiStorageService {
    */
   private getContentType(filePath: string): string {
     const ext = path.extname(filePath).toLowerCase();
-    
-    const contentTypes: Record<string, string> = {
-      '.mp4': 'video/mp4',
-      '.mov': 'video/quicktime',
-      '.avi': 'video/x-msvideo',
-      '.mkv': 'video/x-matroska',
-      '.mp3': 'audio/mpeg',
-      '.wav': 'audio/wav',
-      '.jpg': 'image/jpeg',
-      '.jpeg': 'image/jpeg',
-      '.png': 'image/png',
-    };
-
-    return contentTypes[ext] || 'application/octet-stream';
+    return CONTENT_TYPES[ext] || 'application/octet-stream';
   }
 
   /**
@@ -243,19 +251,28 @@ export class WasabiStorageService {
       // Ensure temp directory exists
       await fs.mkdir(config.storage.tempDir, { recursive: true });
 
-      // Stream to file
-      const chunks: Uint8Array[] = [];
-      for await (const chunk of response.Body as any) {
-        chunks.push(chunk);
+      // Stream to file without buffering the whole object in memory
+      try {
+        await pipeline(response.Body as Readable, createWriteStream(localPath));
+      } catch (error) {
+        // Don't leave a truncated download behind in the temp directory
+        await fs.unlink(localPath).catch((unlinkError: NodeJS.ErrnoException) => {
+          if (unlinkError.code !== 'ENOENT') {
+            logger.warn('Failed to remove partial download', {
+              localPath,
+              error: unlinkError.message,
+            });
+          }
+        });
+        throw error;
       }
-      const buffer = Buffer.concat(chunks);
-      await fs.writeFile(localPath, buffer);
+      const stats = await fs.stat(localPath);
 
       logger.info('Video downloaded successfully', {
         key,
         jobId,
         localPath,
-        size: buffer.length,
+        size: stats.size,
       });
 
       return localPath;
@@ -351,8 +368,12 @@ export class WasabiStorageService {
    * Calculate file hash (MD5)
    */
   private async calculateFileHash(filePath: string): Promise<string> {
-    const fileBuffer = await fs.readFile(filePath);
-    return crypto.createHash('md5').update(fileBuffer).digest('hex');
+    // Hash incrementally so large videos are never held in memory at once
+    const hash = crypto.createHash('md5');
+    for await (const chunk of createReadStream(filePath)) {
+      hash.update(chunk);
+    }
+    return hash.digest('hex');
   }
 
   /**
@@ -401,7 +422,7 @@ export class WasabiStorageService {
     });
 
     // Cache metadata
-    this.metadataCache.set(key, {
+    this.cacheMetadata({
       key,
       hash,
       size: result.size,
@@ -421,7 +442,7 @@ export class WasabiStorageService {
   ): Promise<UploadResult> {
     const hash = await this.calculateFileHash(localPath);
     const ext = path.extname(localPath);
-    const sanitizedTerm = searchTerm.replace(/[^a-z0-9]/gi, '-').toLowerCase();
+    const sanitizedTerm = searchTerm.replace(UNSAFE_KEY_CHARS, '-').toLowerCase();
     const key = `broll/${sanitizedTerm}-${hash.substring(0, 8)}${ext}`;
 
     // Check if B-roll with same hash already exists
@@ -448,7 +469,7 @@ export class WasabiStorageService {
     });
 
     // Cache metadata
-    this.metadataCache.set(key, {
+    this.cacheMetadata({
       key,
       hash,
       size: result.size,
@@ -494,7 +515,7 @@ export class WasabiStorageService {
     });
 
     // Cache metadata
-    this.metadataCache.set(key, {
+    this.cacheMetadata({
       key,
       hash,
       size: result.size,
@@ -513,10 +534,9 @@ export class WasabiStorageService {
     category: 'video' | 'broll' | 'sfx' | 'image'
   ): Promise<string | null> {
     // Check cache first
-    for (const [key, metadata] of this.metadataCache.entries()) {
-      if (metadata.hash === hash && metadata.category === category) {
-        return key;
-      }
+    const cachedKey = this.keysByHash.get(`${category}:${hash}`);
+    if (cachedKey) {
+      return cachedKey;
     }
 
     // Search in storage
@@ -557,9 +577,45 @@ export class WasabiStorageService {
   }
 
   /**
-   * List all files with prefix
+   * Cache uploaded file metadata and index its key by category and hash
    */
-  async listFiles(prefix: string): Promise<string[]> {
+  private cacheMetadata(metadata: MediaMetadata): void {
+    const previous = this.metadataCache.get(metadata.key);
+    this.metadataCache.set(metadata.key, metadata);
+
+    // A re-upload to the same key replaces its content, so both its old and
+    // new hash may now belong to a different cached key
+    if (previous && (previous.hash !== metadata.hash || previous.category !== metadata.category)) {
+      this.reindexHash(previous.category, previous.hash);
+      this.reindexHash(metadata.category, metadata.hash);
+      return;
+    }
+
+    // Keep the first key cached for a hash, as the previous scan returned it
+    const hashKey = `${metadata.category}:${metadata.hash}`;
+    if (!this.keysByHash.has(hashKey)) {
+      this.keysByHash.set(hashKey, metadata.key);
+    }
+  }
+
+  /**
+   * Point a hash entry at the first cached key holding it, or drop it
+   */
+  private reindexHash(category: MediaMetadata['category'], hash: string): void {
+    const hashKey = `${category}:${hash}`;
+    for (const [key, cached] of this.metadataCache) {
+      if (cached.hash === hash && cached.category === category) {
+        this.keysByHash.set(hashKey, key);
+        return;
+      }
+    }
+    this.keysByHash.delete(hashKey);
+  }
+
+  /**
+   * List all objects with prefix, keeping each key's LastModified
+   */
+  private async listObjects(prefix: string): Promise<ListedObject[]> {
     try {
       const command = new ListObjectsV2Command({
         Bucket: this.bucket,
@@ -568,7 +624,15 @@ export class WasabiStorageService {
 
       const response = await this.s3Client.send(command);
 
-      return response.Contents?.map(obj => obj.Key || '').filter(key => key) || [];
+      // Collect keyed objects in one pass rather than mapping then filtering
+      const objects: ListedObject[] = [];
+      for (const obj of response.Contents ?? []) {
+        if (obj.Key) {
+          objects.push({ key: obj.Key, lastModified: obj.LastModified });
+        }
+      }
+
+      return objects;
     } catch (error) {
       logger.error('Failed to list files', {
         prefix,
@@ -578,35 +642,62 @@ export class WasabiStorageService {
     }
   }
 
+  /**
+   * List all files with prefix
+   */
+  async listFiles(prefix: string): Promise<string[]> {
+    const objects = await this.listObjects(prefix);
+    return objects.map((obj) => obj.key);
+  }
+
   /**
    * Delete old files (cleanup)
    */
   async deleteOldFiles(prefix: string, olderThanDays: number): Promise<number> {
     try {
-      const files = await this.listFiles(prefix);
+      const objects = await this.listObjects(prefix);
       const cutoffDate = new Date();
       cutoffDate.setDate(cutoffDate.getDate() - olderThanDays);
 
-      let deletedCount = 0;
+      // The listing already carries each object's LastModified, so pick the
+      // expired keys from it instead of sending a HeadObject per key
+      const expiredKeys: string[] = [];
+      for (const obj of objects) {
+        if (obj.lastModified && obj.lastModified < cutoffDate) {
+          expiredKeys.push(obj.key);
+        }
+      }
 
-      for (const key of files) {
+      // Remove the expired keys with one batch request instead of a request
+      // per key; a listing page never exceeds the 1000-key batch limit
+      let deletedCount = 0;
+      if (expiredKeys.length > 0) {
         try {
-          const command = new HeadObjectCommand({
-            Bucket: this.bucket,
-            Key: key,
-          });
-
-          const response = await this.s3Client.send(command);
-
-          if (response.LastModified && response.LastModified < cutoffDate) {
-            await this.deleteFile(key);
-            deletedCount++;
+          const deleteResponse = await this.s3Client.send(
+            new DeleteObjectsCommand({
+              Bucket: this.bucket,
+              Delete: {
+                Objects: expiredKeys.map((key) => ({ Key: key })),
+                Quiet: false,
+              },
+            })
+          );
+
+          deletedCount = deleteResponse.Deleted?.length ?? 0;
+
+          for (const failure of deleteResponse.Errors ?? []) {
+            logger.warn('Failed to delete old file', {
+              key: failure.Key,
+              error: failure.Message ?? failure.Code,
+            });
           }
         } catch (error) {
-          logger.warn('Failed to check/delete file', {
-            key,
+          // A rejected batch request must not abort the whole cleanup
+          logger.warn('Batch delete failed, deleting old files one by one', {
+            prefix,
             error: error instanceof Error ? error.message : String(error),
           });
+          deletedCount = await this.deleteKeysIndividually(expiredKeys);
         }
       }
 
@@ -625,6 +716,39 @@ export class WasabiStorageService {
       throw error;
     }
   }
+
+  /**
+   * Delete keys one request each, a few at a time, returning how many succeeded
+   */
+  private async deleteKeysIndividually(keys: string[]): Promise<number> {
+    let deletedCount = 0;
+
+    for (let i = 0; i < keys.length; i += MAX_CONCURRENT_DELETES) {
+      const batch = keys.slice(i, i + MAX_CONCURRENT_DELETES);
+      const deleted = await Promise.all(
+        batch.map(async (key) => {
+          try {
+            await this.deleteFile(key);
+            return true;
+          } catch (error) {
+            logger.warn('Failed to delete old file', {
+              key,
+              error: error instanceof Error ? error.message : String(error),
+            });
+            return false;
+          }
+        })
+      );
+
+      for (const wasDeleted of deleted) {
+        if (wasDeleted) {
+          deletedCount++;
+        }
+      }
+    }
+
+    return deletedCount;
+  }
 }
 
 export default new WasabiStorageService();
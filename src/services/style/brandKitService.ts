@@ -12,6 +12,10 @@ import { ProcessingError } from '../../utils/errors';
 
 const logger = createLogger('BrandKitService');
 
+// Allowed brand kit values, built once and shared by every validation
+const VALID_STYLE_FAMILIES: ReadonlySet<string> = new Set(['modern', 'minimal', 'dynamic', 'playful', 'professional']);
+const VALID_TRANSITION_TYPES: ReadonlySet<string> = new Set(['fade', 'slide', 'wipe']);
+
 // Brand Kit Schema
 export interface BrandKit {
   name: string;
@@ -135,6 +139,8 @@ export interface VisualElement {
 export class BrandKitService {
   private brandKit: BrandKit | null = null;
   private brandKitPath: string;
+  // Source file identity of the loaded brand kit, used to skip unchanged reloads
+  private brandKitSource: { filePath: string; mtimeMs: number; size: number } | null = null;
 
   constructor(brandKitPath?: string) {
     this.brandKitPath = brandKitPath || path.join(process.cwd(), 'brand-kit.json');
@@ -149,6 +155,20 @@ export class BrandKitService {
     try {
       logger.info('Loading brand kit', { filePath });
 
+      // Reuse the loaded brand kit if the file has not changed since
+      const stats = await fs.stat(filePath);
+      const source = this.brandKitSource;
+      if (
+        this.brandKit &&
+        source &&
+        source.filePath === filePath &&
+        source.mtimeMs === stats.mtimeMs &&
+        source.size === stats.size
+      ) {
+        logger.debug('Brand kit unchanged, using loaded copy', { filePath });
+        return this.brandKit;
+      }
+
       const fileContent = await fs.readFile(filePath, 'utf-8');
       const brandKit = JSON.parse(fileContent) as BrandKit;
 
@@ -156,6 +176,7 @@ export class BrandKitService {
       this.validateBrandKit(brandKit);
 
       this.brandKit = brandKit;
+      this.brandKitSource = { filePath, mtimeMs: stats.mtimeMs, size: stats.size };
 
       logger.info('Brand kit loaded successfully', {
         name: brandKit.name,
@@ -168,6 +189,7 @@ export class BrandKitService {
       if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
         logger.warn('Brand kit file not found, using default', { filePath });
         this.brandKit = this.getDefaultBrandKit();
+        this.brandKitSource = null;
         return this.brandKit;
       }
 
@@ -260,10 +282,9 @@ export class BrandKitService {
       throw new Error('Brand kit must have animation preferences');
     }
 
-    const validStyleFamilies = ['modern', 'minimal', 'dynamic', 'playful', 'professional'];
-    if (!validStyleFamilies.includes(brandKit.animationPreferences.styleFamily)) {
+    if (!VALID_STYLE_FAMILIES.has(brandKit.animationPreferences.styleFamily)) {
       throw new Error(
-        `Invalid style family: ${brandKit.animationPreferences.styleFamily}. Must be one of: ${validStyleFamilies.join(', ')}`
+        `Invalid style family: ${brandKit.animationPreferences.styleFamily}. Must be one of: ${[...VALID_STYLE_FAMILIES].join(', ')}`
       );
     }
 
@@ -272,10 +293,9 @@ export class BrandKitService {
       throw new Error('Brand kit must have transition preferences');
     }
 
-    const validTransitionTypes = ['fade', 'slide', 'wipe'];
-    if (!validTransitionTypes.includes(brandKit.transitionPreferences.type)) {
+    if (!VALID_TRANSITION_TYPES.has(brandKit.transitionPreferences.type)) {
       throw new Error(
-        `Invalid transition type: ${brandKit.transitionPreferences.type}. Must be one of: ${validTransitionTypes.join(', ')}`
+        `Invalid transition type: ${brandKit.transitionPreferences.type}. Must be one of: ${[...VALID_TRANSITION_TYPES].join(', ')}`
       );
     }
 
@@ -411,15 +431,18 @@ export class BrandKitService {
     // Validate animation templates are from selected set
     if (editingPlan.animations) {
       const usedTemplates = new Set<string>();
+      // Build the lookup set and message once instead of per animation
+      const selectedTemplates = new Set<string>(styleGuide.selectedTemplates);
+      const expectedTemplates = `One of: ${styleGuide.selectedTemplates.join(', ')}`;
       
       for (const animation of editingPlan.animations) {
         usedTemplates.add(animation.template);
         
-        if (!styleGuide.selectedTemplates.includes(animation.template)) {
+        if (!selectedTemplates.has(animation.template)) {
           violations.push({
             element: `animation-${animation.template}`,
             property: 'template',
-            expected: `One of: ${styleGuide.selectedTemplates.join(', ')}`,
+            expected: expectedTemplates,
             actual: animation.template,
             severity: 'error',
           });
@@ -521,13 +544,23 @@ export class BrandKitService {
       }
     }
 
-    const isConsistent = violations.filter((v) => v.severity === 'error').length === 0;
+    // Tally severities in one pass instead of filtering the list three times
+    let errorCount = 0;
+    let warningCount = 0;
+    for (const violation of violations) {
+      if (violation.severity === 'error') {
+        errorCount++;
+      } else if (violation.severity === 'warning') {
+        warningCount++;
+      }
+    }
+    const isConsistent = errorCount === 0;
 
     logger.info('Style consistency validation complete', {
       isConsistent,
       violations: violations.length,
-      errors: violations.filter((v) => v.severity === 'error').length,
-      warnings: violations.filter((v) => v.severity === 'warning').length,
+      errors: errorCount,
+      warnings: warningCount,
     });
 
     return {
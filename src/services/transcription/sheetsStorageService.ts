@@ -16,6 +16,11 @@ export class SheetsStorageService {
    * Initialize Google Sheets API authentication
    */
   async initialize(): Promise<void> {
+    // The authenticated client is reused once set up
+    if (this.auth && this.sheets) {
+      return;
+    }
+
     try {
       logger.info('Initializing Google Sheets API', {
         credentialsPath: config.googleSheets.credentials,
@@ -8,6 +8,16 @@ import { ProcessingError } from '../../utils/errors';
 
 const logger = createLogger('TranscriptionService');
 
+// SRT patterns, compiled once at module load rather than per block
+const SRT_BLOCK_SEPARATOR = /\r?\n\s*\r?\n/;
+const SRT_LINE_SEPARATOR = /\r?\n/;
+const SRT_TIMESTAMP_LINE = /(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,.](\d{3})/;
+const SRT_TIMESTAMP_LINE_STRICT = /^\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}$/;
+
+// Whisper output markers as single alternations, so each chunk is scanned once
+const WHISPER_PROGRESS = /%|segments/;
+const WHISPER_WARNING = /Warning|Error/;
+
 export interface TranscriptSegment {
   start: number;
   end: number;
@@ -183,6 +193,7 @@ export class TranscriptionService {
       '--language', 'en',  // Specify language to avoid detection overhead
       '--verbose', 'False', // Reduce verbose output
       '--word_timestamps', 'False', // Disable word timestamps for faster processing
+      '--fp16', config.whisper.fp16 ? 'True' : 'False', // Half-precision inference
     ];
 
     logger.info('Running Whisper command', {
@@ -211,7 +222,7 @@ export class TranscriptionService {
         const output = data.toString();
         stdout += output;
         // Log progress information
-        if (output.includes('%') || output.includes('segments')) {
+        if (WHISPER_PROGRESS.test(output)) {
           logger.info('Whisper progress', { jobId, output: output.trim() });
         } else {
           logger.debug('Whisper stdout', { output: output.trim() });
@@ -222,7 +233,7 @@ export class TranscriptionService {
         const output = data.toString();
         stderr += output;
         // Log warnings but not debug info
-        if (output.includes('Warning') || output.includes('Error')) {
+        if (WHISPER_WARNING.test(output)) {
           logger.warn('Whisper stderr', { jobId, output: output.trim() });
         } else {
           logger.debug('Whisper stderr', { output: output.trim() });
@@ -256,11 +267,14 @@ export class TranscriptionService {
       });
     });
 
+    // Read and split the SRT once and reuse the blocks for parsing and validation
+    const blocks = this.splitSRTBlocks(await fs.readFile(srtPath, 'utf-8'));
+
     // Parse SRT file to extract segments
-    const segments = await this.parseSRT(srtPath);
+    const segments = this.parseSRTBlocks(blocks, srtPath);
 
     // Validate SRT file
-    await this.validateSRT(srtPath);
+    this.validateSRTBlocks(blocks, srtPath);
 
     return {
       srtPath,
@@ -272,27 +286,15 @@ export class TranscriptionService {
    * Write segments to SRT file
    */
   private async writeSRT(srtPath: string, segments: TranscriptSegment[]): Promise<void> {
-    const lines: string[] = [];
-
-    for (let i = 0; i < segments.length; i++) {
-      const segment = segments[i];
-      
-      // Sequence number
-      lines.push(String(i + 1));
-      
-      // Timestamp line
+    // Build each block in one go: sequence number, timestamp line, text
+    const blocks = segments.map((segment, i) => {
       const startTime = this.formatSRTTimestamp(segment.start);
       const endTime = this.formatSRTTimestamp(segment.end);
-      lines.push(`${startTime} --> ${endTime}`);
-      
-      // Text
-      lines.push(segment.text);
-      
-      // Empty line between segments
-      lines.push('');
-    }
+      return `${i + 1}\n${startTime} --> ${endTime}\n${segment.text}\n`;
+    });
 
-    await fs.writeFile(srtPath, lines.join('\n'), 'utf-8');
+    // Blank line between blocks
+    await fs.writeFile(srtPath, blocks.join('\n'), 'utf-8');
     
     logger.info('SRT file written', {
       srtPath,
@@ -305,13 +307,25 @@ export class TranscriptionService {
    */
   private async parseSRT(srtPath: string): Promise<TranscriptSegment[]> {
     const content = await fs.readFile(srtPath, 'utf-8');
-    const segments: TranscriptSegment[] = [];
-    
+    return this.parseSRTBlocks(this.splitSRTBlocks(content), srtPath);
+  }
+
+  /**
+   * Split SRT content into subtitle blocks
+   */
+  private splitSRTBlocks(content: string): string[] {
     // Split by double newline to get each subtitle block (handle both \n and \r\n)
-    const blocks = content.trim().split(/\r?\n\s*\r?\n/);
+    return content.trim().split(SRT_BLOCK_SEPARATOR);
+  }
+
+  /**
+   * Parse already-split SRT blocks into segments
+   */
+  private parseSRTBlocks(blocks: string[], srtPath: string): TranscriptSegment[] {
+    const segments: TranscriptSegment[] = [];
     
     for (const block of blocks) {
-      const lines = block.trim().split(/\r?\n/);
+      const lines = block.trim().split(SRT_LINE_SEPARATOR);
       
       if (lines.length < 3) {
         continue; // Skip invalid blocks
@@ -322,18 +336,18 @@ export class TranscriptionService {
       // Line 2+: text
       
       const timestampLine = lines[1].trim(); // Remove any whitespace/carriage returns
-      const timestampMatch = timestampLine.match(
-        /(\d{2}):(\d{2}):(\d{2})[,.](\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2})[,.](\d{3})/
-      );
+      const timestampMatch = timestampLine.match(SRT_TIMESTAMP_LINE);
       
       if (!timestampMatch) {
         logger.warn('Invalid timestamp format', { timestampLine, block: block.substring(0, 100) });
         continue;
       }
       
-      const startSeconds = this.parseSRTTimestamp(timestampMatch.slice(1, 5));
-      const endSeconds = this.parseSRTTimestamp(timestampMatch.slice(5, 9));
-      const text = lines.slice(2).join(' ').trim();
+      // Read the capture groups in place rather than slicing them into new arrays
+      const startSeconds = this.parseSRTTimestamp(timestampMatch, 1);
+      const endSeconds = this.parseSRTTimestamp(timestampMatch, 5);
+      // Most blocks carry a single text line; only slice and join when there are more
+      const text = (lines.length === 3 ? lines[2] : lines.slice(2).join(' ')).trim();
       
       segments.push({
         start: startSeconds,
@@ -355,15 +369,18 @@ export class TranscriptionService {
    */
   private async validateSRT(srtPath: string): Promise<void> {
     const content = await fs.readFile(srtPath, 'utf-8');
-    
-    // Check if file is empty
-    if (!content.trim()) {
+    this.validateSRTBlocks(this.splitSRTBlocks(content), srtPath);
+  }
+
+  /**
+   * Validate already-split SRT blocks
+   */
+  private validateSRTBlocks(blocks: string[], srtPath: string): void {
+    // Check if file is empty (blank content splits into a single empty block)
+    if (blocks.length === 1 && !blocks[0]) {
       throw new Error('SRT file is empty');
     }
     
-    // Split by double newline to get each subtitle block (handle both \n and \r\n)
-    const blocks = content.trim().split(/\r?\n\s*\r?\n/);
-    
     if (blocks.length === 0) {
       throw new Error('SRT file contains no subtitle blocks');
     }
@@ -371,7 +388,7 @@ export class TranscriptionService {
     // Validate each block
     for (let i = 0; i < blocks.length; i++) {
       const block = blocks[i].trim();
-      const lines = block.split(/\r?\n/).map(line => line.trim());
+      const lines = block.split(SRT_LINE_SEPARATOR).map(line => line.trim());
       
       if (lines.length < 3) {
         throw new Error(`SRT block ${i + 1} has fewer than 3 lines`);
@@ -384,13 +401,13 @@ export class TranscriptionService {
       }
       
       // Validate timestamp format (handle both \r\n and \n line endings)
-      const timestampPattern = /^\d{2}:\d{2}:\d{2}[,\.]\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}[,\.]\d{3}$/;
-      if (!timestampPattern.test(lines[1])) {
+      if (!SRT_TIMESTAMP_LINE_STRICT.test(lines[1])) {
         throw new Error(`SRT block ${i + 1} has invalid timestamp format: ${lines[1]}`);
       }
       
       // Validate text is non-empty
-      const text = lines.slice(2).join(' ').trim();
+      // Same single-line fast path as parseSRTBlocks
+      const text = (lines.length === 3 ? lines[2] : lines.slice(2).join(' ')).trim();
       if (!text) {
         throw new Error(`SRT block ${i + 1} has empty text`);
       }
@@ -416,12 +433,13 @@ export class TranscriptionService {
 
   /**
    * Parse SRT timestamp to seconds
+   * Reads hours, minutes, seconds and milliseconds starting at `offset`
    */
-  private parseSRTTimestamp(parts: string[]): number {
-    const hours = parseInt(parts[0], 10);
-    const minutes = parseInt(parts[1], 10);
-    const seconds = parseInt(parts[2], 10);
-    const milliseconds = parseInt(parts[3], 10);
+  private parseSRTTimestamp(parts: ArrayLike<string>, offset: number = 0): number {
+    const hours = parseInt(parts[offset], 10);
+    const minutes = parseInt(parts[offset + 1], 10);
+    const seconds = parseInt(parts[offset + 2], 10);
+    const milliseconds = parseInt(parts[offset + 3], 10);
     
     return hours * 3600 + minutes * 60 + seconds + milliseconds / 1000;
   }
@@ -19,7 +19,9 @@ import { processVideo } from '../pipeline/pipelineOrchestrator';
 
 const logger = createLogger('VideoUploadHandler');
 
-const SUPPORTED_FORMATS = ['mp4', 'mov', 'avi', 'mkv'];
+// Lowercase container formats accepted for upload, built once and shared by every call
+const SUPPORTED_FORMATS: ReadonlySet<string> = new Set(['mp4', 'mov', 'avi', 'mkv']);
+const SUPPORTED_FORMATS_LIST = [...SUPPORTED_FORMATS].join(', ');
 
 export class VideoUploadHandler {
 
@@ -130,9 +132,9 @@ export class VideoUploadHandler {
       const fileExtension = path.extname(file.originalname).toLowerCase().slice(1);
       
       // Validate format
-      if (!SUPPORTED_FORMATS.includes(fileExtension)) {
+      if (!SUPPORTED_FORMATS.has(fileExtension)) {
         errors.push(
-          `Unsupported video format: ${fileExtension}. Supported formats: ${SUPPORTED_FORMATS.join(', ')}`
+          `Unsupported video format: ${fileExtension}. Supported formats: ${SUPPORTED_FORMATS_LIST}`
         );
       }
 
@@ -140,7 +142,7 @@ export class VideoUploadHandler {
       const metadata = await this.extractMetadata(file.path);
       
       // Verify the format matches what ffmpeg detected
-      if (metadata.format && !SUPPORTED_FORMATS.includes(metadata.format)) {
+      if (metadata.format && !SUPPORTED_FORMATS.has(metadata.format)) {
         errors.push(
           `Video format mismatch or corrupted file. Detected format: ${metadata.format}`
         );
@@ -8,6 +8,10 @@ import { ProcessingError } from '../../utils/errors';
 
 const logger = createLogger('AutoEditorService');
 
+// Progress markers as single alternations, so each output chunk is scanned once
+const STDOUT_PROGRESS = /%|frame|time=/;
+const STDERR_PROGRESS = /%|Analyzing|Cutting/;
+
 export interface AutoEditorOptions {
   margin: string;
   editMode: 'audio' | 'motion';
@@ -161,7 +165,7 @@ export class AutoEditorService {
         const output = data.toString();
         stdout += output;
         // Log progress information at info level for visibility
-        if (output.includes('%') || output.includes('frame') || output.includes('time=')) {
+        if (STDOUT_PROGRESS.test(output)) {
           logger.info('Auto Editor progress', { output: output.trim() });
         } else {
           logger.debug('Auto Editor stdout', { output: output.trim() });
@@ -172,7 +176,7 @@ export class AutoEditorService {
         const output = data.toString();
         stderr += output;
         // Auto Editor outputs progress to stderr, log it at info level
-        if (output.includes('%') || output.includes('Analyzing') || output.includes('Cutting')) {
+        if (STDERR_PROGRESS.test(output)) {
           logger.info('Auto Editor progress', { output: output.trim() });
         } else {
           logger.debug('Auto Editor stderr', { output: output.trim() });
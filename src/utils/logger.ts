@@ -49,6 +49,11 @@ export class Logger {
   }
 
   private log(level: LogLevel, message: string, metadata?: LogMetadata): void {
+    // Skip building the log entry for levels no transport will write
+    if (!logger.isLevelEnabled(level)) {
+      return;
+    }
+
     logger.log(level, message, {
       context: this.context,
       ...metadata,